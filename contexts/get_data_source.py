@@ -193,8 +193,7 @@ class DataSourceFetcher:
 
         # Count files and calculate size
         print(f"[7/7] Gathering statistics...")
-        total_files = sum(1 for _ in self.target_dir.rglob("*") if _.is_file() and ".git" not in _.parts)
-        total_size = sum(f.stat().st_size for f in self.target_dir.rglob("*") if f.is_file() and ".git" not in f.parts)
+        total_files, total_size = self._file_stats()
         
         # Format size nicely
         if total_size < 1024:
@@ -214,6 +213,30 @@ class DataSourceFetcher:
         print(f"  Paths: {num_paths}")
         print(f"{'=' * 60}\n")
 
+    def _file_stats(self) -> tuple:
+        """
+        Count the checked-out files and their total size in one directory walk.
+
+        .git directories are pruned rather than walked and filtered out.
+
+        Returns:
+            Tuple of (file count, total size in bytes)
+        """
+        total_files = 0
+        total_size = 0
+        pending = [self.target_dir]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.name == ".git":
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        total_files += 1
+                        total_size += entry.stat().st_size
+        return total_files, total_size
+
     def list_contents(self) -> None:
         """List the contents that were checked out."""
         if not self.target_dir.exists():
@@ -0,0 +1,8 @@
+"""
+Command-line scripts for the extraction workflow.
+
+Each script is run directly (e.g. `python3 scripts/validate_partition.py <source>`),
+by the agent or the Makefile. The package marker lets the workflow import
+shared functions such as validate_partition.validate_and_get_errors with a
+normal import when run from the project root.
+"""
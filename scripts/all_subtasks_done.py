@@ -32,8 +32,7 @@ def load_checklist() -> dict:
         print(f"❌ Checklist not found: {checklist_path}")
         sys.exit(1)
     
-    with open(checklist_path, 'r') as f:
-        return json.load(f)
+    return json.loads(checklist_path.read_bytes())
 
 
 def check_all_subtasks_done(item_item_id: str) -> tuple[bool, list]:
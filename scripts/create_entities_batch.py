@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Create Entities Batch Script
+Adds several entities to the master entity ontology file in one call.
+
+Reads a JSON list of entities from stdin. The ontology is loaded and saved
+once for the whole batch, instead of once per create_entity.py invocation.
+
+Usage:
+    echo '<json list>' | python scripts/create_entities_batch.py
+
+Example:
+    echo '[{"type": "Red Hat Product", "description": "A Red Hat product involved in the KCS article",
+            "example_file": "data/rosa-kcs/kcs_solutions/example.md",
+            "example_in_file": "Openshift Container Platform 4"}]' | python scripts/create_entities_batch.py
+
+Entities whose type already exists (case-insensitive) are skipped, as in create_entity.py.
+"""
+
+import json
+import sys
+
+from create_entity import load_entity_ontology, save_entity_ontology, get_next_entity_id
+
+
+ENTITY_FIELDS = ("type", "description", "example_file", "example_in_file")
+
+
+def validate_entities(new_entities: list):
+    """
+    Check that every entry in the batch is a complete entity.
+    
+    Runs before anything is added, so a bad entry rejects the whole batch
+    instead of leaving earlier entries reported as created but never saved.
+    
+    Args:
+        new_entities: Parsed stdin payload
+    
+    Raises:
+        ValueError: If any entry is not a dict with all ENTITY_FIELDS
+    """
+    problems = []
+    for index, new_entity in enumerate(new_entities):
+        if not isinstance(new_entity, dict):
+            problems.append(f"entry {index} is not a JSON object")
+            continue
+        missing = [field for field in ENTITY_FIELDS if field not in new_entity]
+        if missing:
+            problems.append(f"entry {index} is missing field(s): {', '.join(missing)}")
+    
+    if problems:
+        raise ValueError("Batch rejected, nothing was created: " + "; ".join(problems))
+
+
+def create_entities(new_entities: list) -> list:
+    """
+    Create several entities in the master entity ontology.
+    
+    The batch is validated up front; if any entry is invalid nothing is created.
+    
+    Args:
+        new_entities: List of dicts with type, description, example_file and example_in_file
+    
+    Returns:
+        List of the entity objects that were created (duplicates are not included)
+    
+    Raises:
+        ValueError: If any entry is not a complete entity
+    """
+    validate_entities(new_entities)
+    
+    ontology = load_entity_ontology()
+    entities = ontology.get("entities", [])
+    existing_types = {entity.get("type", "").lower() for entity in entities}
+    next_id = int(get_next_entity_id(entities))
+    
+    created = []
+    for new_entity in new_entities:
+        entity_type = new_entity["type"]
+        
+        # Check for duplicates, including earlier entries in this batch
+        if entity_type.lower() in existing_types:
+            print(f"⚠️  Entity type '{entity_type}' already exists in master ontology - skipped")
+            continue
+        
+        entity = {
+            "entity_id": str(next_id),
+            "type": entity_type,
+            "example_file": new_entity["example_file"],
+            "description": new_entity["description"],
+            "example_in_file": new_entity["example_in_file"]
+        }
+        entities.append(entity)
+        existing_types.add(entity_type.lower())
+        created.append(entity)
+        next_id += 1
+    
+    # Save updated ontology once for the whole batch, and only report entities
+    # as created once they are on disk
+    if created:
+        ontology["entities"] = entities
+        save_entity_ontology(ontology)
+    
+    for entity in created:
+        print(f"✅ Created entity {entity['entity_id']}: {entity['type']}")
+    
+    return created
+
+
+def main():
+    """Command-line interface for creating entities in batch."""
+    try:
+        new_entities = json.load(sys.stdin)
+    except json.JSONDecodeError as e:
+        print(f"❌ stdin is not valid JSON: {e}", file=sys.stderr)
+        print("Usage: echo '[{\"type\": ..., \"description\": ..., \"example_file\": ..., \"example_in_file\": ...}]' | python scripts/create_entities_batch.py")
+        sys.exit(1)
+    
+    if not isinstance(new_entities, list):
+        print("❌ Expected a JSON list of entities on stdin", file=sys.stderr)
+        sys.exit(1)
+    
+    try:
+        created = create_entities(new_entities)
+        print(f"\n📋 Created {len(created)} of {len(new_entities)} entities")
+        sys.exit(0)
+    except Exception as e:
+        print(f"❌ Error creating entities: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
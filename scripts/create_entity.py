@@ -27,16 +27,15 @@ def load_entity_ontology() -> dict:
         print(f"   Run init_partition_ontologies.py first to create the ontology files.")
         sys.exit(1)
     
-    with open(ontology_path, 'r') as f:
-        return json.load(f)
+    return json.loads(ontology_path.read_bytes())
 
 
 def save_entity_ontology(ontology_data: dict):
     """Save the master entity ontology."""
     ontology_path = Path("ontology") / "master_entity_ontology.json"
     
-    with open(ontology_path, 'w') as f:
-        json.dump(ontology_data, f, indent=2)
+    # Serialize in memory and write with a single call
+    ontology_path.write_bytes(json.dumps(ontology_data, indent=2).encode("utf-8"))
 
 
 def get_next_entity_id(entities: list) -> str:
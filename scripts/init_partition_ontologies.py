@@ -11,10 +11,16 @@ This will create:
     - ontology/master_relationship_ontology.json
 """
 
-import json
 import sys
 from pathlib import Path
 
+# Initial contents of the master ontology files, serialized once; byte-identical
+# to json.dump(..., indent=2) of the empty ontology
+EMPTY_MASTER_ONTOLOGIES = {
+    "master_entity_ontology.json": b'{\n  "entities": []\n}',
+    "master_relationship_ontology.json": b'{\n  "relationships": []\n}',
+}
+
 
 def init_master_ontologies() -> bool:
     """
@@ -26,23 +32,11 @@ def init_master_ontologies() -> bool:
     ontology_dir = Path("ontology")
     ontology_dir.mkdir(parents=True, exist_ok=True)
     
-    # Create master entity ontology file
-    entity_path = ontology_dir / "master_entity_ontology.json"
-    entity_ontology = {"entities": []}
-    
-    with open(entity_path, 'w') as f:
-        json.dump(entity_ontology, f, indent=2)
-    
-    print(f"✅ Created {entity_path}")
-    
-    # Create master relationship ontology file
-    relationship_path = ontology_dir / "master_relationship_ontology.json"
-    relationship_ontology = {"relationships": []}
-    
-    with open(relationship_path, 'w') as f:
-        json.dump(relationship_ontology, f, indent=2)
-    
-    print(f"✅ Created {relationship_path}")
+    # Contents are fixed, so write the pre-serialized bytes directly
+    for file_name, content in EMPTY_MASTER_ONTOLOGIES.items():
+        ontology_path = ontology_dir / file_name
+        ontology_path.write_bytes(content)
+        print(f"✅ Created {ontology_path}")
     
     return True
 
@@ -11,7 +11,7 @@ Supports:
 import json
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 
@@ -97,7 +97,7 @@ def check_off_item(checklist_id: str, item_id: str, metadata: Optional[Dict] = N
         if item["item_id"] == item_id:
             item["completed"] = True
             item.setdefault("metadata", {})
-            item["metadata"]["completed_at"] = datetime.utcnow().isoformat() + "Z"
+            item["metadata"]["completed_at"] = datetime.now(timezone.utc).isoformat()
 
             # Add additional metadata if provided
             if metadata:
@@ -31,16 +31,15 @@ def load_checklist() -> dict:
         print(f"❌ Checklist not found: {checklist_path}")
         sys.exit(1)
     
-    with open(checklist_path, 'r') as f:
-        return json.load(f)
+    return json.loads(checklist_path.read_bytes())
 
 
 def save_checklist(checklist_data: dict):
     """Save the checklist to JSON file."""
     checklist_path = Path("checklists") / f"{CHECKLIST_ID}.json"
     
-    with open(checklist_path, 'w') as f:
-        json.dump(checklist_data, f, indent=2)
+    # Serialize in memory and write with a single call
+    checklist_path.write_bytes(json.dumps(checklist_data, indent=2).encode("utf-8"))
 
 
 def mark_subtask_complete(item_item_id: str, subtask_item_id: str) -> bool:
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Mark Subtasks Batch Script
+Marks several subtasks complete in the 03_create_ontologies_for_each_partition checklist.
+
+The checklist is loaded and saved once for the whole batch, instead of once per
+mark_subtask.py invocation.
+
+Usage:
+    python scripts/mark_subtasks_batch.py <item_item_id> <subtask_item_id> [subtask_item_id ...]
+
+Example:
+    python scripts/mark_subtasks_batch.py 3.1 3.1.2 3.1.3 3.1.4
+"""
+
+import sys
+from datetime import datetime, timezone
+
+from mark_subtask import load_checklist, save_checklist
+
+
+def mark_subtasks_complete(item_item_id: str, subtask_item_ids: list) -> bool:
+    """
+    Mark several subtasks of one item as complete.
+    
+    Args:
+        item_item_id: The parent item ID (e.g., "3.1" for partition 1)
+        subtask_item_ids: The subtask IDs to mark complete (e.g., ["3.1.2", "3.1.3"])
+    
+    Returns:
+        True if every subtask was found and marked, False otherwise
+    """
+    checklist = load_checklist()
+    
+    item = next((i for i in checklist.get("items", []) if i.get("item_id") == item_item_id), None)
+    if item is None:
+        print(f"❌ Item '{item_item_id}' not found in checklist")
+        return False
+    
+    subtasks_by_id = {subtask.get("item_id"): subtask for subtask in item.get("subtasks", [])}
+    missing = [subtask_id for subtask_id in subtask_item_ids if subtask_id not in subtasks_by_id]
+    if missing:
+        print(f"❌ Subtask(s) {', '.join(missing)} not found under item '{item_item_id}'")
+        return False
+    
+    completed_at = datetime.now(timezone.utc).isoformat()
+    for subtask_id in subtask_item_ids:
+        subtask = subtasks_by_id[subtask_id]
+        subtask["completed"] = True
+        subtask["completed_at"] = completed_at
+    
+    # Check if ALL subtasks are now complete
+    if all(st.get("completed", False) for st in item.get("subtasks", [])):
+        item["completed"] = True
+        item["completed_at"] = completed_at
+        print(f"  ✓ All subtasks complete for {item_item_id} - marking parent item complete")
+    
+    # Save updated checklist once for the whole batch
+    save_checklist(checklist)
+    print(f"✅ Marked {len(subtask_item_ids)} subtask(s) as complete: {', '.join(subtask_item_ids)}")
+    return True
+
+
+def main():
+    """Command-line interface for marking subtasks complete in batch."""
+    if len(sys.argv) < 3:
+        print("Usage: python scripts/mark_subtasks_batch.py <item_item_id> <subtask_item_id> [subtask_item_id ...]")
+        print("\nExample:")
+        print("  python scripts/mark_subtasks_batch.py 3.1 3.1.2 3.1.3 3.1.4")
+        sys.exit(1)
+    
+    success = mark_subtasks_complete(sys.argv[1], sys.argv[2:])
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ master ontology, consolidating similar types and maintaining source tracking.
 import json
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List
 
 
@@ -49,7 +49,7 @@ def update_master_ontology(
         master_ontology = {
             "ontology_type": ontology_type,
             "version": "0.1.0",
-            "last_updated": datetime.utcnow().isoformat() + "Z",
+            "last_updated": datetime.now(timezone.utc).isoformat(),
             "elements": []
         }
 
@@ -119,7 +119,7 @@ def update_master_ontology(
 
     # Update metadata
     master_ontology["elements"] = master_elements
-    master_ontology["last_updated"] = datetime.utcnow().isoformat() + "Z"
+    master_ontology["last_updated"] = datetime.now(timezone.utc).isoformat()
 
     # Increment patch version
     version_parts = master_ontology["version"].split(".")
@@ -19,17 +19,32 @@ resolved against the data source path (e.g., "data/openshift-docs/").
 """
 
 import json
+import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 
 
-def load_partition_files(data_source: str) -> List[Dict]:
+# Fields every partition JSON file must define
+REQUIRED_PARTITION_FIELDS = (
+    "partition_id",
+    "title",
+    "description",
+    "paths",
+    "entity_ontology",
+    "relationship_ontology",
+)
+
+
+def load_partition_files(data_source: str, cache: Optional[Dict] = None) -> List[Dict]:
     """
     Load all partition JSON files for a specific data source.
     
     Args:
         data_source: Name of the data source (e.g., "openshift-docs")
+        cache: Optional dict mapping partition file path to
+            ((st_mtime_ns, st_size), parsed_data); files whose signature is
+            unchanged since the last load are not re-parsed
         
     Returns:
         List of partition dictionaries with file path and data
@@ -41,17 +56,37 @@ def load_partition_files(data_source: str) -> List[Dict]:
         print(f"❌ Partitions directory '{partitions_path}' does not exist")
         return []
 
-    for file_path in sorted(partitions_path.glob("*.json")):
-        try:
-            with open(file_path, 'r') as f:
-                partition_data = json.load(f)
+    # One scandir pass with a suffix check instead of a glob pattern match
+    with os.scandir(partitions_path) as entries:
+        partition_names = sorted(
+            entry.name for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        )
+
+    for file_path in (partitions_path / name for name in partition_names):
+        if cache is not None:
+            stat = os.stat(file_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = cache.get(str(file_path))
+            if cached is not None and cached[0] == signature:
                 partition_files.append({
                     "file": str(file_path),
-                    "data": partition_data
+                    "data": cached[1]
                 })
+                continue
+        
+        try:
+            partition_data = json.loads(file_path.read_bytes())
+            partition_files.append({
+                "file": str(file_path),
+                "data": partition_data
+            })
         except json.JSONDecodeError as e:
             print(f"❌ Error parsing {file_path}: {e}")
             return []
+        
+        if cache is not None:
+            cache[str(file_path)] = (signature, partition_data)
 
     return partition_files
 
@@ -83,7 +118,11 @@ def get_all_data_files(data_source: str) -> Set[str]:
     return data_files
 
 
-def expand_partition_paths(partition_paths: List[str], data_source: str) -> Set[str]:
+def expand_partition_paths(
+    partition_paths: List[str],
+    data_source: str,
+    dir_cache: Optional[Dict[str, Set[str]]] = None
+) -> Set[str]:
     """
     Expand partition paths to include all actual files.
     
@@ -93,6 +132,8 @@ def expand_partition_paths(partition_paths: List[str], data_source: str) -> Set[
     Args:
         partition_paths: List of relative paths from partition JSON (may include directory refs)
         data_source: Name of the data source (e.g., "openshift-docs")
+        dir_cache: Optional dict mapping directory references to their expanded
+            files; directories already in it are not walked again
         
     Returns:
         Set of relative file paths (from data source root)
@@ -103,7 +144,12 @@ def expand_partition_paths(partition_paths: List[str], data_source: str) -> Set[
     for path in partition_paths:
         # Check if path ends with '/' (directory reference)
         if path.endswith('/'):
+            if dir_cache is not None and path in dir_cache:
+                expanded_files.update(dir_cache[path])
+                continue
+            
             # This is a directory reference - expand to all files in that directory
+            dir_files = set()
             dir_path = data_source_base / path.rstrip('/')
             
             if dir_path.exists() and dir_path.is_dir():
@@ -112,8 +158,12 @@ def expand_partition_paths(partition_paths: List[str], data_source: str) -> Set[
                     if file_path.is_file() and ".git" not in file_path.parts:
                         # Get relative path from data source root
                         rel_path = file_path.relative_to(data_source_base)
-                        expanded_files.add(str(rel_path))
+                        dir_files.add(str(rel_path))
             # If directory doesn't exist, we'll catch it in invalid_files check
+            
+            expanded_files.update(dir_files)
+            if dir_cache is not None:
+                dir_cache[path] = dir_files
         else:
             # This is a specific file reference - use as-is (relative path)
             expanded_files.add(path)
@@ -121,7 +171,12 @@ def expand_partition_paths(partition_paths: List[str], data_source: str) -> Set[
     return expanded_files
 
 
-def validate_partitions(partitions: List[Dict], data_files: Set[str], data_source: str) -> Tuple[bool, Dict]:
+def validate_partitions(
+    partitions: List[Dict],
+    data_files: Set[str],
+    data_source: str,
+    dir_cache: Optional[Dict[str, Set[str]]] = None
+) -> Tuple[bool, Dict]:
     """
     Validate that partitions form a complete, disjoint cover of data files.
 
@@ -129,6 +184,7 @@ def validate_partitions(partitions: List[Dict], data_files: Set[str], data_sourc
         partitions: List of partition dictionaries
         data_files: Set of relative file paths from data source
         data_source: Name of the data source (e.g., "openshift-docs")
+        dir_cache: Optional directory expansion cache, see expand_partition_paths
 
     Returns:
         Tuple of (is_valid, results_dict)
@@ -151,9 +207,7 @@ def validate_partitions(partitions: List[Dict], data_files: Set[str], data_sourc
         partition = partition_info["data"]
 
         # Validate required fields
-        required_fields = ["partition_id", "title", "description", "paths",
-                          "entity_ontology", "relationship_ontology"]
-        missing_fields = [f for f in required_fields if f not in partition]
+        missing_fields = [f for f in REQUIRED_PARTITION_FIELDS if f not in partition]
         if missing_fields:
             results["errors"].append(
                 f"{partition_file}: Missing required fields: {missing_fields}"
@@ -164,7 +218,7 @@ def validate_partitions(partitions: List[Dict], data_files: Set[str], data_sourc
         paths = partition["paths"]
 
         # Expand directory references to actual files
-        expanded_files = expand_partition_paths(paths, data_source)
+        expanded_files = expand_partition_paths(paths, data_source, dir_cache)
         
         # Check each expanded file
         for file_path in expanded_files:
@@ -321,28 +375,40 @@ def main():
     return 0 if is_valid else 1
 
 
-def validate_and_get_errors(data_source: str) -> tuple[bool, str]:
+def validate_and_get_errors(data_source: str, cache: Optional[Dict] = None) -> tuple[bool, str]:
     """
     Validation function for use by other scripts (e.g., Claude SDK workflow).
     
     Args:
         data_source: Name of the data source to validate (e.g., "openshift-docs")
+        cache: Optional dict owned by the caller and reused across calls for the
+            same data source (e.g. retry attempts). Unchanged partition files are
+            not re-parsed, and the data file listing and directory reference
+            expansions are computed once, since the agent cannot modify data/
+            (see configure_claude_agent_settings).
     
     Returns:
         Tuple of (is_valid, error_message_string)
     """
     # Load partition files for this data source
-    partitions = load_partition_files(data_source)
+    partition_cache = cache.setdefault("partitions", {}) if cache is not None else None
+    partitions = load_partition_files(data_source, partition_cache)
     if not partitions:
         return False, f"No partition files found in partitions/{data_source}/ or error loading them"
 
     # Get all data files for this data source
-    data_files = get_all_data_files(data_source)
+    if cache is not None and "data_files" in cache:
+        data_files = cache["data_files"]
+    else:
+        data_files = get_all_data_files(data_source)
+        if cache is not None and data_files:
+            cache["data_files"] = data_files
     if not data_files:
         return False, f"No data files found in data/{data_source}/"
 
     # Validate
-    is_valid, results = validate_partitions(partitions, data_files, data_source)
+    dir_cache = cache.setdefault("expanded_dirs", {}) if cache is not None else None
+    is_valid, results = validate_partitions(partitions, data_files, data_source, dir_cache)
     
     if is_valid:
         return True, "All partitions valid"
@@ -4,8 +4,14 @@ Base agent utilities for Claude Agent SDK interactions.
 Provides shared utilities and message handling patterns for agent sessions.
 """
 
+from pathlib import Path
+
 from claude_agent_sdk import AssistantMessage, ToolUseBlock, ToolResultBlock, TextBlock
 
+# Working directory handed to every agent session. The workflow runs from the
+# project root and never changes directory, so it is resolved once at import.
+AGENT_CWD = str(Path.cwd())
+
 
 def handle_assistant_message(message: AssistantMessage, prefix: str = "") -> None:
     """
@@ -51,12 +57,12 @@ def handle_result_message(message, prefix: str = "") -> tuple[bool, str]:
     Returns:
         Tuple of (success: bool, error_message: str or None)
     """
-    if hasattr(message, 'subtype'):
-        if message.subtype == 'success':
-            return True, None
-        elif message.subtype == 'error':
-            error_msg = str(getattr(message, 'result', 'Unknown error'))
-            return False, error_msg
+    subtype = getattr(message, 'subtype', None)
+    if subtype == 'success':
+        return True, None
+    elif subtype == 'error':
+        error_msg = str(getattr(message, 'result', 'Unknown error'))
+        return False, error_msg
     
     # Default to success if no subtype
     return True, None
@@ -4,12 +4,18 @@ Ontology creation agent.
 Provides the async function to run a Claude agent session for ontology creation.
 """
 
-from pathlib import Path
 from typing import Dict, Optional
 
 from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions, AssistantMessage, ToolUseBlock
 
-from ..helpers.logging import log_message, log_prompt_to_file, finalize_attempt_log
+from .base_agent import AGENT_CWD
+from ..helpers.logging import (
+    RecentMessageIds,
+    log_message_async,
+    log_prompt_to_file,
+    mark_attempt_started_async,
+    finalize_attempt_log_async,
+)
 from ..prompts.ontology_prompts import build_ontology_creation_prompt
 
 
@@ -43,17 +49,20 @@ async def run_ontology_agent(
     options = ClaudeAgentOptions(
         allowed_tools=["Bash", "Read", "Write"],
         permission_mode="acceptEdits",
-        cwd=str(Path.cwd()),
+        cwd=AGENT_CWD,
         env={
             "PARTITION_ITEM_ID": item_id
         }
     )
     
     message_count = 0
-    processed_message_ids = set()
+    processed_message_ids = RecentMessageIds()
     
     print(f"🤖 Starting agent for Partition {partition_id}: {partition.get('title', 'Unknown')}")
     
+    # Set started timestamp
+    await mark_attempt_started_async(step_name, attempt_num)
+    
     try:
         async with ClaudeSDKClient(options=options) as client:
             # Send initial query
@@ -67,7 +76,7 @@ async def run_ontology_agent(
                 message_type = type(message).__name__
                 
                 # Log the message
-                log_message(step_name, attempt_num, message_count, message, message_type, processed_message_ids)
+                await log_message_async(step_name, attempt_num, message_count, message, message_type, processed_message_ids)
                 
                 # Handle different message types (minimal output to avoid spam)
                 if isinstance(message, AssistantMessage):
@@ -79,25 +88,25 @@ async def run_ontology_agent(
                                 print(f"  [P{partition_id}] 🔧 {cmd_preview}")
                 
                 # Check for completion
-                if hasattr(message, 'subtype'):
-                    if message.subtype == 'success':
-                        print(f"  [P{partition_id}] ✅ Completed ({message_count} messages)")
-                        finalize_attempt_log(step_name, attempt_num, "success")
-                        return partition_id, True, None
-                    elif message.subtype == 'error':
-                        error_msg = str(getattr(message, 'result', 'Unknown error'))
-                        print(f"  [P{partition_id}] ❌ Error: {error_msg[:50]}...")
-                        finalize_attempt_log(step_name, attempt_num, "failed", error_msg)
-                        return partition_id, False, error_msg
+                subtype = getattr(message, 'subtype', None)
+                if subtype == 'success':
+                    print(f"  [P{partition_id}] ✅ Completed ({message_count} messages)")
+                    await finalize_attempt_log_async(step_name, attempt_num, "success")
+                    return partition_id, True, None
+                elif subtype == 'error':
+                    error_msg = str(getattr(message, 'result', 'Unknown error'))
+                    print(f"  [P{partition_id}] ❌ Error: {error_msg[:50]}...")
+                    await finalize_attempt_log_async(step_name, attempt_num, "failed", error_msg)
+                    return partition_id, False, error_msg
             
             # If we exit the loop without a result message, task is complete
             print(f"  [P{partition_id}] ✅ Session completed ({message_count} messages)")
-            finalize_attempt_log(step_name, attempt_num, "success")
+            await finalize_attempt_log_async(step_name, attempt_num, "success")
             return partition_id, True, None
             
     except Exception as e:
         error_msg = str(e)
         print(f"  [P{partition_id}] ❌ Exception: {error_msg[:50]}...")
-        finalize_attempt_log(step_name, attempt_num, "failed", error_msg)
+        await finalize_attempt_log_async(step_name, attempt_num, "failed", error_msg)
         return partition_id, False, error_msg
 
@@ -4,12 +4,12 @@ Partition creation agent.
 Provides the async function to run a Claude agent session for partition creation.
 """
 
-from pathlib import Path
 from typing import Optional
 
 from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions, AssistantMessage, ToolUseBlock, TextBlock
 
-from ..helpers.logging import log_message, finalize_attempt_log
+from .base_agent import AGENT_CWD
+from ..helpers.logging import RecentMessageIds, log_message_async
 
 
 async def run_partition_creation_attempt(
@@ -32,11 +32,11 @@ async def run_partition_creation_attempt(
     options = ClaudeAgentOptions(
         allowed_tools=["Bash"],  # Allow Claude to run bash commands
         permission_mode="acceptEdits",  # Auto-accept tool executions
-        cwd=str(Path.cwd())  # Set working directory to project root
+        cwd=AGENT_CWD  # Set working directory to project root
     )
     
     message_count = 0
-    processed_message_ids = set()  # Track message IDs to avoid double-counting token usage
+    processed_message_ids = RecentMessageIds()  # Track message IDs to avoid double-counting token usage
     
     try:
         async with ClaudeSDKClient(options=options) as client:
@@ -57,7 +57,7 @@ async def run_partition_creation_attempt(
                 message_type = type(message).__name__
                 
                 # Log the message
-                log_message(step_name, attempt_num, message_count, message, message_type, processed_message_ids)
+                await log_message_async(step_name, attempt_num, message_count, message, message_type, processed_message_ids)
                 
                 # Handle different message types
                 if isinstance(message, AssistantMessage):
@@ -76,15 +76,15 @@ async def run_partition_creation_attempt(
                                 print(f"🔧 Running: {cmd_preview}")
                 
                 # Check for completion
-                if hasattr(message, 'subtype'):
-                    if message.subtype == 'success':
-                        print(f"\n✅ Claude completed the task successfully!")
-                        print(f"   Total messages exchanged: {message_count}")
-                        return True, None
-                    elif message.subtype == 'error':
-                        error_msg = str(getattr(message, 'result', 'Unknown error'))
-                        print(f"\n❌ Claude encountered an error: {error_msg}")
-                        return False, error_msg
+                subtype = getattr(message, 'subtype', None)
+                if subtype == 'success':
+                    print(f"\n✅ Claude completed the task successfully!")
+                    print(f"   Total messages exchanged: {message_count}")
+                    return True, None
+                elif subtype == 'error':
+                    error_msg = str(getattr(message, 'result', 'Unknown error'))
+                    print(f"\n❌ Claude encountered an error: {error_msg}")
+                    return False, error_msg
             
             # If we exit the loop without a result message, task is complete
             print(f"\n✅ Claude agent session completed")
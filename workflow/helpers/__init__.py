@@ -6,14 +6,25 @@ Modules:
     - config: Configuration loading and agent settings
     - checklist: Checklist management functions
     - filesystem: Folder reset and cleanup utilities
+    - partitions: Cached loading of partition files
+    - runtime: Event loop shared by the workflow steps
 """
 
 from .logging import (
     log_to_file,
     log_prompt_to_file,
     log_message,
+    log_message_async,
+    RecentMessageIds,
+    mark_attempt_started,
+    mark_attempt_started_async,
     finalize_attempt_log,
+    finalize_attempt_log_async,
+    print_banner,
+    BANNER_WIDTH,
     print_usage_summary,
+    clear_log_cache,
+    materialize_logs,
     STEP_1_LOG_DIR,
 )
 from .config import (
@@ -30,9 +41,20 @@ from .checklist import (
     mark_master_checklist_step_complete,
 )
 from .filesystem import (
+    write_bytes_atomic,
+    write_json_atomic,
     reset_partitions_folder,
     reset_logging,
-    reset_ontologies_folder,
+    reset_ontology_folder,
+)
+from .partitions import (
+    get_all_partitions,
+    clear_partition_cache,
+)
+from .runtime import (
+    get_event_loop,
+    run_async,
+    close_event_loop,
 )
 
 __all__ = [
@@ -40,8 +62,17 @@ __all__ = [
     "log_to_file",
     "log_prompt_to_file",
     "log_message",
+    "log_message_async",
+    "RecentMessageIds",
+    "mark_attempt_started",
+    "mark_attempt_started_async",
     "finalize_attempt_log",
+    "finalize_attempt_log_async",
+    "print_banner",
+    "BANNER_WIDTH",
     "print_usage_summary",
+    "clear_log_cache",
+    "materialize_logs",
     "STEP_1_LOG_DIR",
     # config
     "load_config",
@@ -55,8 +86,17 @@ __all__ = [
     "mark_checklist_item_complete",
     "mark_master_checklist_step_complete",
     # filesystem
+    "write_bytes_atomic",
+    "write_json_atomic",
     "reset_partitions_folder",
     "reset_logging",
-    "reset_ontologies_folder",
+    "reset_ontology_folder",
+    # partitions
+    "get_all_partitions",
+    "clear_partition_cache",
+    # runtime
+    "get_event_loop",
+    "run_async",
+    "close_event_loop",
 ]
 
@@ -8,27 +8,56 @@ Provides functions for:
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
+
+from .filesystem import write_json_atomic
+
+# Parsed checklists keyed by checklist_id, with the (st_mtime_ns, st_size) of the
+# file they were parsed from. Agent scripts (e.g. scripts/mark_subtask.py) rewrite
+# checklists from other processes, so entries are validated against the file on
+# every load rather than trusted until explicitly cleared.
+_CHECKLIST_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    """Return (st_mtime_ns, st_size) for path."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
 
 
 def load_checklist(checklist_id: str) -> Dict:
-    """Load a specific checklist file"""
+    """
+    Load a specific checklist file.
+    
+    The parsed checklist is cached and reused while the file is unchanged on
+    disk, so repeated loads cost one stat() instead of a read and parse. The
+    returned dict is the cached object: callers that modify it must pass it
+    to save_checklist().
+    """
     checklist_path = Path(f"checklists/{checklist_id}.json")
     
-    if not checklist_path.exists():
-        raise FileNotFoundError(f"Checklist {checklist_id} not found")
+    try:
+        signature = _file_signature(checklist_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Checklist {checklist_id} not found") from None
+    
+    cached = _CHECKLIST_CACHE.get(checklist_id)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
     
-    with open(checklist_path, 'r') as f:
-        return json.load(f)
+    checklist = json.loads(checklist_path.read_bytes())
+    _CHECKLIST_CACHE[checklist_id] = (signature, checklist)
+    return checklist
 
 
 def save_checklist(checklist_id: str, checklist_data: Dict):
     """Save checklist to JSON file."""
     checklist_path = Path(f"checklists/{checklist_id}.json")
     
-    with open(checklist_path, 'w') as f:
-        json.dump(checklist_data, f, indent=2)
+    write_json_atomic(checklist_path, checklist_data)
+    _CHECKLIST_CACHE[checklist_id] = (_file_signature(checklist_path), checklist_data)
     print(f"  ✓ Reset checklist: {checklist_id}")
 
 
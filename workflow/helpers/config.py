@@ -7,13 +7,71 @@ Provides functions for:
 - Configuring Claude agent settings
 """
 
+import hashlib
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import List, Mapping, Sequence, Tuple
 
+from .filesystem import write_json_atomic
 
-def load_config() -> Dict:
-    """Load extraction configuration"""
+# Deny rules applied to every data source folder; {path} is e.g. "data/openshift-docs"
+DENY_RULE_TEMPLATES = (
+    "Write(./{path}/**)",
+    "Bash(rm:*{path}*)",
+    "Bash(mv:*{path}*)",
+    "Bash(cp:*{path}*)",
+    "Bash(mkdir:*{path}*)",
+    "Bash(touch:*{path}*)",
+    "Bash(echo:*>{path}*)",
+    "Bash(cat:*>{path}*)",
+    "Bash(cd:*{path}*&&*mkdir*)",
+)
+
+# Sidecar recording which rule set settings.local.json was last configured with
+SETTINGS_STAMP_FILE = Path(".claude/.settings.stamp")
+
+
+def _settings_stamp(data_path: str, allow_rules: List[str], deny_rules: List[str]) -> str:
+    """Hash the inputs of configure_claude_agent_settings into a stamp string."""
+    key = f"{data_path}|{sorted(allow_rules)}|{sorted(deny_rules)}"
+    return hashlib.blake2b(key.encode("utf-8")).hexdigest()
+
+
+def _settings_stamp_is_current(settings_file: Path, stamp: str) -> bool:
+    """
+    Check whether settings_file was already configured for this stamp.
+    
+    The stamp only counts if settings_file has not been modified since the
+    stamp was written, so manual edits to the settings force a full re-check.
+    """
+    if not settings_file.exists() or not SETTINGS_STAMP_FILE.exists():
+        return False
+    
+    if settings_file.stat().st_mtime_ns > SETTINGS_STAMP_FILE.stat().st_mtime_ns:
+        return False
+    
+    return SETTINGS_STAMP_FILE.read_text() == stamp
+
+
+def _write_settings_stamp(stamp: str):
+    """Atomically record the stamp for the current settings configuration."""
+    tmp_path = SETTINGS_STAMP_FILE.with_name(SETTINGS_STAMP_FILE.name + ".tmp")
+    tmp_path.write_text(stamp)
+    os.replace(tmp_path, SETTINGS_STAMP_FILE)
+
+
+@lru_cache(maxsize=1)
+def load_config() -> Mapping:
+    """
+    Load extraction configuration.
+    
+    The file is parsed once per process. The result is a read-only mapping so
+    callers cannot mutate the cached copy; use load_config.cache_clear() to
+    force a re-read.
+    """
     config_file = Path("extraction_config.json")
     
     if not config_file.exists():
@@ -22,18 +80,20 @@ def load_config() -> Dict:
             "use_current_partition": False,
             "use_current_ontologies": False
         }
-        with open(config_file, 'w') as f:
-            json.dump(default_config, f, indent=2)
-        return default_config
+        write_json_atomic(config_file, default_config)
+        return MappingProxyType(default_config)
     
-    with open(config_file, 'r') as f:
-        return json.load(f)
+    return MappingProxyType(json.loads(config_file.read_bytes()))
 
 
+@lru_cache(maxsize=1)
 def get_data_source_path() -> str:
     """
     Get the data source path to extract from.
     Returns the 'data/' directory path.
+    
+    The existence check runs once per process; use
+    get_data_source_path.cache_clear() to force a re-check.
     """
     data_dir = Path("data")
     
@@ -43,12 +103,16 @@ def get_data_source_path() -> str:
     return str(data_dir)
 
 
-def get_data_sources() -> List[str]:
+@lru_cache(maxsize=1)
+def get_data_sources() -> Tuple[str, ...]:
     """
-    Get a list of all data source folder names in data/ directory.
+    Get all data source folder names in data/ directory.
+    
+    The directory is scanned once per process; use get_data_sources.cache_clear()
+    to force a re-scan.
     
     Returns:
-        List of data source folder names (e.g., ["openshift-docs", "ops-sop", "rosa-kcs"])
+        Tuple of data source folder names (e.g., ("openshift-docs", "ops-sop", "rosa-kcs"))
     """
     data_dir = Path("data")
     
@@ -56,7 +120,7 @@ def get_data_sources() -> List[str]:
         raise FileNotFoundError("data/ directory does not exist")
     
     # Get all subdirectories in data/
-    subdirs = sorted([d.name for d in data_dir.iterdir() if d.is_dir()])
+    subdirs = tuple(sorted(d.name for d in data_dir.iterdir() if d.is_dir()))
     
     if len(subdirs) == 0:
         raise FileNotFoundError("No subdirectories found in data/")
@@ -64,7 +128,7 @@ def get_data_sources() -> List[str]:
     return subdirs
 
 
-def configure_claude_agent_settings(data_path: str, data_sources: List[str]):
+def configure_claude_agent_settings(data_path: str, data_sources: Sequence[str]):
     """
     Configure .claude/settings.local.json with required permissions for the agent.
     
@@ -74,6 +138,10 @@ def configure_claude_agent_settings(data_path: str, data_sources: List[str]):
     
     Only adds rules if not already present. Does not remove existing rules.
     
+    Skips reading the settings file entirely when .claude/.settings.stamp shows
+    it was already configured for the same data path and rules and has not
+    been edited since.
+    
     Args:
         data_path: Path to the data directory (e.g., "data")
         data_sources: List of data source folder names (e.g., ["openshift-docs", "ops-sop", "rosa-kcs"])
@@ -88,26 +156,24 @@ def configure_claude_agent_settings(data_path: str, data_sources: List[str]):
         "Bash(make:*)"
     ]
     
-    # Build deny rules for all data sources
-    required_deny_rules = []
-    for data_source in data_sources:
-        data_source_path = f"{data_path}/{data_source}"
-        required_deny_rules.extend([
-            f"Write(./{data_source_path}/**)",
-            f"Bash(rm:*{data_source_path}*)",
-            f"Bash(mv:*{data_source_path}*)",
-            f"Bash(cp:*{data_source_path}*)",
-            f"Bash(mkdir:*{data_source_path}*)",
-            f"Bash(touch:*{data_source_path}*)",
-            f"Bash(echo:*>{data_source_path}*)",
-            f"Bash(cat:*>{data_source_path}*)",
-            f"Bash(cd:*{data_source_path}*&&*mkdir*)",
-        ])
+    # Build deny rules for all data sources; each source path is joined once,
+    # not once per template
+    source_paths = [f"{data_path}/{data_source}" for data_source in data_sources]
+    required_deny_rules = [
+        template.format(path=source_path)
+        for source_path in source_paths
+        for template in DENY_RULE_TEMPLATES
+    ]
+    
+    # Skip the settings round-trip if nothing changed since the last run
+    stamp = _settings_stamp(data_path, required_allow_rules, required_deny_rules)
+    if _settings_stamp_is_current(settings_file, stamp):
+        print(f"  ✓ Agent settings already configured")
+        return
     
     # Load existing settings or create default structure
     if settings_file.exists():
-        with open(settings_file, 'r') as f:
-            settings = json.load(f)
+        settings = json.loads(settings_file.read_bytes())
     else:
         # Create .claude directory if needed
         settings_file.parent.mkdir(parents=True, exist_ok=True)
@@ -121,30 +187,31 @@ def configure_claude_agent_settings(data_path: str, data_sources: List[str]):
     if "deny" not in settings["permissions"]:
         settings["permissions"]["deny"] = []
     
-    modified = False
-    
-    # Add missing allow rules
+    # Add missing allow rules (set lookup keeps this linear in the rule count)
     allow_list = settings["permissions"]["allow"]
-    for rule in required_allow_rules:
-        if rule not in allow_list:
-            allow_list.append(rule)
-            modified = True
-            print(f"  ✓ Added allow rule: {rule}")
+    existing_allow = set(allow_list)
+    new_allow_rules = [rule for rule in required_allow_rules if rule not in existing_allow]
+    allow_list.extend(new_allow_rules)
+    for rule in new_allow_rules:
+        print(f"  ✓ Added allow rule: {rule}")
     
     # Add missing deny rules
     deny_list = settings["permissions"]["deny"]
-    for rule in required_deny_rules:
-        if rule not in deny_list:
-            deny_list.append(rule)
-            modified = True
+    existing_deny = set(deny_list)
+    new_deny_rules = [rule for rule in required_deny_rules if rule not in existing_deny]
+    deny_list.extend(new_deny_rules)
+    
+    modified = bool(new_allow_rules or new_deny_rules)
     
     if modified:
         print(f"  ✓ Added data source protection for: {', '.join(data_sources)}")
     
     # Write back to file only if modified
     if modified:
-        with open(settings_file, 'w') as f:
-            json.dump(settings, f, indent=2)
+        write_json_atomic(settings_file, settings)
     else:
         print(f"  ✓ Agent settings already configured")
+    
+    # Stamp is written after the settings file so its mtime is never older
+    _write_settings_stamp(stamp)
 
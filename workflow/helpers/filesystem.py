@@ -2,31 +2,97 @@
 Filesystem utilities for the extraction workflow.
 
 Provides functions for:
+- Atomically writing bytes and JSON files
 - Resetting the partitions folder
 - Resetting the logging file
 - Resetting the ontology folder
 """
 
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+from .partitions import clear_partition_cache
+
+__all__ = [
+    "write_bytes_atomic",
+    "write_json_atomic",
+    "reset_partitions_folder",
+    "reset_logging",
+    "reset_ontology_folder",
+]
+
+# Upper bound on threads used to delete folders in parallel
+RESET_MAX_WORKERS = 8
+
+
+def write_bytes_atomic(path: Path, payload: bytes):
+    """
+    Write bytes to a file atomically.
+    
+    The payload goes to a sibling temp file through a raw file descriptor
+    (no buffered file object is set up), which is then moved over the target
+    with os.replace so a crash mid-write never leaves a truncated file behind.
+    
+    Args:
+        path: Destination file path
+        payload: File contents
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        # os.write may write less than asked; small payloads take one call
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def write_json_atomic(path: Path, data, indent: Optional[int] = 2):
+    """
+    Write JSON to a file atomically.
+    
+    The payload is serialized in memory and written with write_bytes_atomic.
+    
+    Args:
+        path: Destination file path
+        data: JSON-serializable object
+        indent: Indentation level passed to json.dumps; None writes compact
+            JSON with no whitespace between tokens
+    """
+    path = Path(path)
+    separators = (",", ":") if indent is None else None
+    payload = json.dumps(data, indent=indent, separators=separators, ensure_ascii=False).encode("utf-8")
+    write_bytes_atomic(path, payload)
 
 
 def reset_partitions_folder():
     """Remove all partition subfolders and file subsets from partitions/ folder"""
     partitions_dir = Path("partitions")
     
+    # Partitions loaded before the reset must not be served afterwards
+    clear_partition_cache()
+    
     if not partitions_dir.exists():
         partitions_dir.mkdir(parents=True, exist_ok=True)
         print(f"  ✓ Created partitions/ directory")
         return
     
     # Remove all data source subdirectories (e.g., partitions/openshift-docs/)
-    subdirs = [d for d in partitions_dir.iterdir() if d.is_dir()]
+    # scandir answers is_dir() from the directory entry without an extra stat
+    with os.scandir(partitions_dir) as entries:
+        subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
     
     if subdirs:
-        for subdir in subdirs:
-            shutil.rmtree(subdir)
+        # Deletions are independent, so overlap their unlink latency
+        with ThreadPoolExecutor(max_workers=min(RESET_MAX_WORKERS, len(subdirs))) as executor:
+            list(executor.map(shutil.rmtree, subdirs))
         print(f"  ✓ Removed {len(subdirs)} existing partition folder(s)")
     else:
         print(f"  ✓ Partitions folder already empty")
@@ -34,20 +100,25 @@ def reset_partitions_folder():
 
 def reset_logging():
     """Reset the logging/step_1/ directory to start fresh"""
-    log_dir = Path("logging")
-    step_1_dir = log_dir / "step_1"
+    # Imported locally to avoid a circular import with helpers.logging
+    from .logging import STEP_1_LOG_DIR, clear_log_cache, _ensure_log_dir
+    
+    # Drop any logs still buffered in memory from before the reset
+    clear_log_cache()
     
     # Remove the entire step_1 directory if it exists
-    if step_1_dir.exists():
-        shutil.rmtree(step_1_dir)
+    try:
+        shutil.rmtree(STEP_1_LOG_DIR)
+    except FileNotFoundError:
+        pass
     
-    # Create fresh step_1 directory
-    step_1_dir.mkdir(parents=True, exist_ok=True)
+    # Create fresh step_1 directory (parents=True also creates logging/). Going
+    # through _ensure_log_dir marks it ready, so later log writes skip the mkdir.
+    _ensure_log_dir()
     
     # Create empty logging.json
-    log_file = step_1_dir / "logging.json"
-    with open(log_file, 'w') as f:
-        json.dump({}, f, indent=2, ensure_ascii=False)
+    log_file = STEP_1_LOG_DIR / "logging.json"
+    log_file.write_bytes(b"{}")
     
     print(f"  ✓ Reset logging/step_1/ directory")
 
@@ -67,11 +138,14 @@ def reset_ontology_folder():
         ontology_dir / "master_relationship_ontology.json"
     ]
     
+    # Attempt the unlink directly rather than stat-ing first: one syscall per file
     removed_count = 0
     for ontology_file in master_files:
-        if ontology_file.exists():
+        try:
             ontology_file.unlink()
-            removed_count += 1
+        except FileNotFoundError:
+            continue
+        removed_count += 1
     
     if removed_count:
         print(f"  ✓ Removed {removed_count} existing ontology file(s)")
@@ -2,21 +2,296 @@
 Logging utilities for the extraction workflow.
 
 Provides functions for:
+- Caching logging.json in memory and flushing it to disk
+- Journaling per-message updates to an append-only events.jsonl
+- Materializing the logs from logging.json plus the journal
 - Logging key-value pairs to JSON
 - Logging prompts to text files
 - Tracking message statistics and token usage
 - Finalizing attempt logs with validation results
 """
 
+import asyncio
+import atexit
+import functools
 import json
-from datetime import datetime, timezone
+import os
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+from .filesystem import write_json_atomic
 
 # Step 1 logging directory
 STEP_1_LOG_DIR = Path("logging/step_1")
 
+# Token counters tracked per attempt, in the order they appear in logging.json
+TOKEN_USAGE_KEYS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+
+# Verbose [DEBUG] output for token/cost capture, enabled with KARTO_DEBUG=1
+_DEBUG = os.environ.get("KARTO_DEBUG") == "1"
+
+# logging.json is written compact; KARTO_LOG_PRETTY=1 indents it for reading by eye
+_LOG_JSON_INDENT = 2 if os.environ.get("KARTO_LOG_PRETTY") == "1" else None
+
+# Most message IDs remembered per agent session for usage dedupe (see RecentMessageIds)
+MAX_TRACKED_MESSAGE_IDS = 10000
+
+# Append-only journal of per-message log updates (one JSON object per line)
+EVENTS_FILE_NAME = "events.jsonl"
+
+# Width of the "=" separator lines around console banners
+BANNER_WIDTH = 60
+
+# Guards _LOG_CACHE/_LOG_DIRTY: log updates run on the event loop thread while
+# finalize flushes (which serialize the whole cache) run in worker threads.
+# Reentrant because locked functions call each other (finalize -> flush).
+_LOG_LOCK = threading.RLock()
+
+# In-memory copy of logging.json. Loaded lazily on first use, mutated in place
+# by the log functions, and written back only when dirty (see _flush_logs).
+# Between flushes, events.jsonl is the durable record of per-message updates.
+_LOG_CACHE: Optional[Dict] = None
+_LOG_DIRTY = False
+
+# File descriptor kept open on events.jsonl, opened lazily by _append_event
+_EVENTS_FD: Optional[int] = None
+
+# Whether STEP_1_LOG_DIR is known to exist (see _ensure_log_dir)
+_LOG_DIR_READY = False
+
+
+def _locked(func):
+    """Run func while holding _LOG_LOCK."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _LOG_LOCK:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _ensure_log_dir():
+    """
+    Create STEP_1_LOG_DIR on first use only.
+    
+    Avoids a mkdir syscall on every log write; clear_log_cache() resets the
+    flag since reset_logging() recreates the directory.
+    """
+    global _LOG_DIR_READY
+    
+    if not _LOG_DIR_READY:
+        STEP_1_LOG_DIR.mkdir(parents=True, exist_ok=True)
+        _LOG_DIR_READY = True
+
+
+def _iso_now() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string.
+    
+    Equivalent to datetime.now(timezone.utc).isoformat() (always with
+    microseconds) without allocating a datetime per call.
+    """
+    ns = time.time_ns()
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{remainder // 1000:06d}+00:00"
+
+
+class RecentMessageIds(set):
+    """
+    Set of processed message IDs that forgets the oldest IDs past a cap.
+    
+    Repeated IDs come from parallel tool uses of one assistant turn and arrive
+    back to back, so evicting IDs from long ago never lets usage be counted
+    twice, while keeping memory bounded on long sessions.
+    """
+    
+    def __init__(self, maxlen: int = MAX_TRACKED_MESSAGE_IDS):
+        super().__init__()
+        self._order = deque()
+        self._maxlen = maxlen
+    
+    def add(self, message_id):
+        if message_id in self:
+            return
+        super().add(message_id)
+        self._order.append(message_id)
+        if len(self._order) > self._maxlen:
+            self.discard(self._order.popleft())
+
+
+def _read_usage(usage) -> Dict[str, int]:
+    """
+    Extract the tracked token counters from an SDK usage value.
+    
+    Per SDK docs usage is a dictionary; fall back to attribute access if an
+    object is passed instead.
+    """
+    if isinstance(usage, dict):
+        return {key: usage.get(key, 0) for key in TOKEN_USAGE_KEYS}
+    return {key: getattr(usage, key, 0) for key in TOKEN_USAGE_KEYS}
+
+
+def _ensure_attempt(logs: Dict, step_name: str, attempt_num: int) -> Dict:
+    """
+    Return the log entry for an attempt, creating the step and attempt entries if needed.
+    
+    Args:
+        logs: Indexed log structure (the logging.json contents)
+        step_name: Name of the workflow step
+        attempt_num: Attempt number (1-indexed)
+        
+    Returns:
+        The attempt's entry in logs[step_name]["attempts"]
+    """
+    # Initialize step structure if needed
+    if step_name not in logs:
+        logs[step_name] = {
+            "attempts": []
+        }
+    
+    # Initialize attempt structure if needed
+    attempts = logs[step_name]["attempts"]
+    while len(attempts) < attempt_num:
+        attempts.append({
+            "attempt_number": len(attempts) + 1,
+            # Set by mark_attempt_started when the attempt actually begins
+            "started_at": None,
+            "completed_at": None,
+            "validation_result": None,
+            "validation_errors": None,
+            "result_message": None,
+            "message_count": 0,
+            "token_usage": dict.fromkeys(TOKEN_USAGE_KEYS, 0)
+        })
+    
+    return attempts[attempt_num - 1]
+
+
+def materialize_logs() -> Dict:
+    """
+    Build the indexed log view from logging.json plus the events.jsonl journal.
+    
+    logging.json is only rewritten when an attempt is finalized (or at exit), so
+    after a crash the latest per-message updates exist only in the journal.
+    Events are replayed in order on top of the snapshot. Every event carries
+    absolute values, so replaying events the snapshot already reflects is harmless.
+    
+    Returns:
+        Dictionary with the same structure as logging.json
+    """
+    # logging.json is only ever replaced atomically, so a parse failure means
+    # real corruption and is raised rather than silently discarding the logs
+    log_file = STEP_1_LOG_DIR / "logging.json"
+    logs = json.loads(log_file.read_bytes()) if log_file.exists() else {}
+    
+    events_file = STEP_1_LOG_DIR / EVENTS_FILE_NAME
+    if not events_file.exists():
+        return logs
+    
+    with open(events_file, "rb") as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                # Only the last line can be torn, by a kill mid-write
+                continue
+            
+            attempt = _ensure_attempt(logs, event["step_name"], event["attempt_num"])
+            if "started_at" in event:
+                attempt["started_at"] = event["started_at"]
+            if "message_num" in event:
+                attempt["message_count"] = max(attempt["message_count"], event["message_num"])
+            if "token_usage" in event:
+                attempt["token_usage"] = event["token_usage"]
+            if "result_message" in event:
+                attempt["result_message"] = event["result_message"]
+    
+    return logs
+
+
+def _get_logs() -> Dict:
+    """Return the cached logs, materializing them from disk on first use."""
+    global _LOG_CACHE
+    
+    if _LOG_CACHE is None:
+        _LOG_CACHE = materialize_logs()
+    
+    return _LOG_CACHE
+
+
+def _append_event(event: Dict):
+    """
+    Append one log event to events.jsonl.
+    
+    Each event is a single line written with one os.write() on a descriptor
+    kept open in O_APPEND mode, so the cost is one syscall per message
+    regardless of how large logging.json has grown.
+    """
+    global _EVENTS_FD
+    
+    if _EVENTS_FD is None:
+        _ensure_log_dir()
+        _EVENTS_FD = os.open(
+            STEP_1_LOG_DIR / EVENTS_FILE_NAME,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o644
+        )
+    
+    os.write(_EVENTS_FD, json.dumps(event, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+def _close_events_file():
+    """Close the events.jsonl descriptor if it is open."""
+    global _EVENTS_FD
+    
+    if _EVENTS_FD is not None:
+        os.close(_EVENTS_FD)
+        _EVENTS_FD = None
+
+
+@_locked
+def _flush_logs():
+    """Write the cached logs to logging.json if they changed since the last flush."""
+    global _LOG_DIRTY
+    
+    if not _LOG_DIRTY or _LOG_CACHE is None:
+        return
+    
+    _ensure_log_dir()
+    write_json_atomic(STEP_1_LOG_DIR / "logging.json", _LOG_CACHE, indent=_LOG_JSON_INDENT)
+    
+    _LOG_DIRTY = False
+
+
+# Persist whatever is still buffered if the process exits mid-step
+atexit.register(_flush_logs)
+atexit.register(_close_events_file)
 
+
+@_locked
+def clear_log_cache():
+    """
+    Drop the in-memory logs and start from an empty log.
+    
+    Must be called whenever logging.json is reset on disk so that a later
+    flush does not resurrect stale entries. Also closes events.jsonl so the
+    next event is appended to a fresh file.
+    """
+    global _LOG_CACHE, _LOG_DIRTY, _LOG_DIR_READY
+    _LOG_CACHE = {}
+    _LOG_DIRTY = False
+    _LOG_DIR_READY = False
+    _close_events_file()
+
+
+@_locked
 def log_to_file(key: str, value):
     """
     Log a key-value pair to logging/step_1/logging.json
@@ -25,28 +300,13 @@ def log_to_file(key: str, value):
         key: The log entry key
         value: The log entry value (can be string or dict/list)
     """
-    log_dir = STEP_1_LOG_DIR
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / "logging.json"
-    
-    # Load existing logs or create new dict
-    if log_file.exists():
-        try:
-            with open(log_file, 'r') as f:
-                logs = json.load(f)
-        except json.JSONDecodeError:
-            # If the file is corrupted, start fresh
-            print("⚠️  Warning: logging.json was corrupted, starting fresh log file")
-            logs = {}
-    else:
-        logs = {}
+    global _LOG_DIRTY
     
     # Update the log entry
-    logs[key] = value
+    _get_logs()[key] = value
+    _LOG_DIRTY = True
     
-    # Write back to file with ensure_ascii=False to preserve readability
-    with open(log_file, 'w') as f:
-        json.dump(logs, f, indent=2, ensure_ascii=False)
+    _flush_logs()
 
 
 def log_prompt_to_file(data_source: str, prompt_content: str):
@@ -57,19 +317,20 @@ def log_prompt_to_file(data_source: str, prompt_content: str):
         data_source: Name of the data source (used in filename)
         prompt_content: The actual prompt text content
     """
-    log_dir = STEP_1_LOG_DIR
-    log_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_log_dir()
     
     # Create filename with data source name
-    prompt_file = log_dir / f"file_partition_{data_source}_prompt.txt"
+    prompt_file = STEP_1_LOG_DIR / f"file_partition_{data_source}_prompt.txt"
     
-    # Write prompt as plain text with actual newlines
-    with open(prompt_file, 'w', encoding='utf-8') as f:
-        f.write(prompt_content)
+    # Write prompt as plain text with actual newlines. Encoding up front and
+    # writing bytes issues one write() for the whole prompt instead of the text
+    # layer's buffer-sized chunks, so concurrent step 3 dumps never interleave.
+    prompt_file.write_bytes(prompt_content.encode("utf-8"))
     
     print(f"  ✓ Logged prompt to {prompt_file}")
 
 
+@_locked
 def log_message(step_name: str, attempt_num: int, message_num: int, message, message_type: str, processed_message_ids: set):
     """
     Log messages from Claude Agent SDK interactions.
@@ -84,51 +345,27 @@ def log_message(step_name: str, attempt_num: int, message_num: int, message, mes
         message: The SDK message object
         message_type: Type of message (AssistantMessage, ToolUseBlock, ToolResultBlock, TextBlock, ResultMessage, etc.)
         processed_message_ids: Set of message IDs already processed for token tracking
+            (a RecentMessageIds, or any set)
+    
+    Note:
+        processed_message_ids is owned by the caller and lives for one agent
+        session. SDK message IDs are opaque strings, so dedupe must be exact:
+        a lossy structure (e.g. a bitset over hashed IDs) could drop usage from
+        a genuinely new message. Only eviction of old IDs (RecentMessageIds)
+        is allowed.
+        
+        Updates are applied to the in-memory log. Messages that change token
+        usage or carry the result are also journaled as one line in
+        events.jsonl; logging.json itself is only rewritten when an attempt is
+        finalized (or at exit).
     """
-    log_dir = STEP_1_LOG_DIR
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / "logging.json"
-    
-    # Load existing logs
-    if log_file.exists():
-        try:
-            with open(log_file, 'r') as f:
-                logs = json.load(f)
-        except json.JSONDecodeError:
-            # If the file is corrupted, start fresh
-            logs = {}
-    else:
-        logs = {}
+    global _LOG_DIRTY
     
-    # Initialize step structure if needed
-    if step_name not in logs:
-        logs[step_name] = {
-            "attempts": []
-        }
-    
-    # Initialize attempt structure if needed
-    attempts = logs[step_name]["attempts"]
-    if len(attempts) < attempt_num:
-        attempts.append({
-            "attempt_number": attempt_num,
-            "started_at": datetime.now(timezone.utc).isoformat(),
-            "completed_at": None,
-            "validation_result": None,
-            "validation_errors": None,
-            "result_message": None,
-            "message_count": 0,
-            "token_usage": {
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "cache_creation_input_tokens": 0,
-                "cache_read_input_tokens": 0
-            }
-        })
-    
-    current_attempt = attempts[attempt_num - 1]
+    current_attempt = _ensure_attempt(_get_logs(), step_name, attempt_num)
     
     # Update message count
     current_attempt["message_count"] = message_num
+    usage_changed = False
     
     # Track token usage from AssistantMessage (avoiding double-counting)
     # Per SDK docs: usage is a dictionary, access with .get()
@@ -138,29 +375,22 @@ def log_message(step_name: str, attempt_num: int, message_num: int, message, mes
         # Only process this message ID once to avoid double-counting parallel tool uses
         if message_id not in processed_message_ids:
             processed_message_ids.add(message_id)
-            
+            usage_changed = True
             usage = message.usage
-            # Debug: Print what we're seeing in the usage object
-            print(f"[DEBUG] Captured usage from AssistantMessage {message_id}: {usage}")
+            # Debug: Print what we're seeing in the usage object (KARTO_DEBUG=1)
+            if _DEBUG:
+                print(f"[DEBUG] Captured usage from AssistantMessage {message_id}: {usage}")
             
-            # Usage is a dictionary - use .get() for access
-            if isinstance(usage, dict):
-                current_attempt["token_usage"]["input_tokens"] += usage.get("input_tokens", 0)
-                current_attempt["token_usage"]["output_tokens"] += usage.get("output_tokens", 0)
-                current_attempt["token_usage"]["cache_creation_input_tokens"] += usage.get("cache_creation_input_tokens", 0)
-                current_attempt["token_usage"]["cache_read_input_tokens"] += usage.get("cache_read_input_tokens", 0)
-            else:
-                # Fallback to getattr if it's an object
-                current_attempt["token_usage"]["input_tokens"] += getattr(usage, 'input_tokens', 0)
-                current_attempt["token_usage"]["output_tokens"] += getattr(usage, 'output_tokens', 0)
-                current_attempt["token_usage"]["cache_creation_input_tokens"] += getattr(usage, 'cache_creation_input_tokens', 0)
-                current_attempt["token_usage"]["cache_read_input_tokens"] += getattr(usage, 'cache_read_input_tokens', 0)
+            # Add this message's usage to the attempt totals
+            token_usage = current_attempt["token_usage"]
+            for key, value in _read_usage(usage).items():
+                token_usage[key] += value
     
     # Store the final ResultMessage (full content) and extract cumulative usage
     if message_type == "ResultMessage":
         result_data = {
             "message_type": "ResultMessage",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _iso_now()
         }
         
         # Extract result information
@@ -174,34 +404,81 @@ def log_message(step_name: str, attempt_num: int, message_num: int, message, mes
         # Per SDK docs: ResultMessage has total_cost_usd directly on it
         if hasattr(message, 'total_cost_usd'):
             result_data["total_cost_usd"] = message.total_cost_usd
-            print(f"[DEBUG] Captured total_cost_usd from ResultMessage: ${message.total_cost_usd}")
+            if _DEBUG:
+                print(f"[DEBUG] Captured total_cost_usd from ResultMessage: ${message.total_cost_usd}")
         
         # Extract cumulative usage from ResultMessage (this is the authoritative source)
         if hasattr(message, 'usage'):
+            usage_changed = True
             usage = message.usage
-            print(f"[DEBUG] Captured cumulative usage from ResultMessage: {usage}")
+            if _DEBUG:
+                print(f"[DEBUG] Captured cumulative usage from ResultMessage: {usage}")
             
             # ResultMessage contains total cumulative usage - replace attempt totals
-            # Usage is a dictionary - use .get() for access
-            if isinstance(usage, dict):
-                current_attempt["token_usage"]["input_tokens"] = usage.get("input_tokens", 0)
-                current_attempt["token_usage"]["output_tokens"] = usage.get("output_tokens", 0)
-                current_attempt["token_usage"]["cache_creation_input_tokens"] = usage.get("cache_creation_input_tokens", 0)
-                current_attempt["token_usage"]["cache_read_input_tokens"] = usage.get("cache_read_input_tokens", 0)
-            else:
-                # Fallback to getattr if it's an object
-                current_attempt["token_usage"]["input_tokens"] = getattr(usage, 'input_tokens', 0)
-                current_attempt["token_usage"]["output_tokens"] = getattr(usage, 'output_tokens', 0)
-                current_attempt["token_usage"]["cache_creation_input_tokens"] = getattr(usage, 'cache_creation_input_tokens', 0)
-                current_attempt["token_usage"]["cache_read_input_tokens"] = getattr(usage, 'cache_read_input_tokens', 0)
+            current_attempt["token_usage"].update(_read_usage(usage))
         
         current_attempt["result_message"] = result_data
     
-    # Write back to file with ensure_ascii=False for readability
-    with open(log_file, 'w') as f:
-        json.dump(logs, f, indent=2, ensure_ascii=False)
+    _LOG_DIRTY = True
+    
+    # Most messages (tool use/results, text, repeated message IDs) only bump the
+    # in-memory message count; the final count lands in logging.json on finalize.
+    # Only journal updates that change token usage or carry the result.
+    if not usage_changed and message_type != "ResultMessage":
+        return
+    
+    # Journal this message's update so a crash before the next flush loses nothing
+    event = {
+        "step_name": step_name,
+        "attempt_num": attempt_num,
+        "message_num": message_num,
+        "message_type": message_type
+    }
+    if usage_changed:
+        event["token_usage"] = dict(current_attempt["token_usage"])
+    if message_type == "ResultMessage":
+        event["result_message"] = current_attempt["result_message"]
+    _append_event(event)
 
 
+@_locked
+def mark_attempt_started(step_name: str, attempt_num: int) -> Dict:
+    """
+    Record that an attempt has started, creating its log entry if needed.
+    
+    Called before the agent session connects, so started_at reflects when the
+    attempt actually began rather than when its first message arrived. The
+    entry lives in the in-memory log, which is the single source of truth for
+    the rest of the attempt; the start is journaled to events.jsonl and
+    reaches logging.json with the next flush.
+    
+    Args:
+        step_name: Name of the workflow step
+        attempt_num: Current attempt number (1-indexed)
+        
+    Returns:
+        The attempt's (in-memory) log entry
+    """
+    global _LOG_DIRTY
+    
+    attempt = _ensure_attempt(_get_logs(), step_name, attempt_num)
+    
+    # Nothing to record if the attempt already has a start time
+    if attempt["started_at"] is not None:
+        return attempt
+    
+    attempt["started_at"] = _iso_now()
+    
+    _append_event({
+        "step_name": step_name,
+        "attempt_num": attempt_num,
+        "started_at": attempt["started_at"]
+    })
+    _LOG_DIRTY = True
+    return attempt
+
+
+@_locked
 def finalize_attempt_log(step_name: str, attempt_num: int, validation_result: str, validation_errors: Optional[str] = None):
     """
     Finalize an attempt by adding validation results and calculating totals.
@@ -212,98 +489,127 @@ def finalize_attempt_log(step_name: str, attempt_num: int, validation_result: st
         validation_result: "success" or "failed"
         validation_errors: Error message if validation failed
     """
-    log_dir = STEP_1_LOG_DIR
-    log_file = log_dir / "logging.json"
+    global _LOG_DIRTY
     
-    if not log_file.exists():
-        return
-    
-    try:
-        with open(log_file, 'r') as f:
-            logs = json.load(f)
-    except json.JSONDecodeError:
-        # If the file is corrupted, we can't finalize
-        return
+    logs = _get_logs()
     
     if step_name not in logs or len(logs[step_name]["attempts"]) < attempt_num:
         return
     
-    current_attempt = logs[step_name]["attempts"][attempt_num - 1]
+    step_logs = logs[step_name]
+    current_attempt = step_logs["attempts"][attempt_num - 1]
+    
+    # Only the first finalize of an attempt adds it to the running totals
+    first_finalize = current_attempt.get("completed_at") is None
     
-    # Set completion timestamp and validation results using timezone-aware datetime
-    current_attempt["completed_at"] = datetime.now(timezone.utc).isoformat()
+    # Set completion timestamp and validation results (UTC)
+    current_attempt["completed_at"] = _iso_now()
     current_attempt["validation_result"] = validation_result
     if validation_errors:
         current_attempt["validation_errors"] = validation_errors
     
-    # Get token usage from attempt
-    token_usage = current_attempt.get("token_usage", {
-        "input_tokens": 0,
-        "output_tokens": 0,
-        "cache_creation_input_tokens": 0,
-        "cache_read_input_tokens": 0
-    })
+    # Cumulative statistics are kept as running totals, updated with just this
+    # attempt's numbers instead of re-scanning every attempt of the step
+    summary = step_logs.get("cumulative_summary")
+    if summary is None:
+        summary = step_logs["cumulative_summary"] = {
+            "total_attempts": 0,
+            "successful_attempt": None,
+            "total_messages": 0,
+            "cumulative_token_usage": dict.fromkeys(TOKEN_USAGE_KEYS, 0),
+            "total_cost_usd": 0.0
+        }
     
-    # Calculate cumulative statistics across all attempts for this step
-    cumulative_messages = 0
-    cumulative_input_tokens = 0
-    cumulative_output_tokens = 0
-    cumulative_cache_creation_tokens = 0
-    cumulative_cache_read_tokens = 0
-    cumulative_cost = 0.0
-    successful_attempt = None
-    
-    for idx, attempt in enumerate(logs[step_name]["attempts"]):
-        cumulative_messages += attempt.get("message_count", 0)
+    if first_finalize:
+        summary["total_messages"] += current_attempt.get("message_count", 0)
         
         # Accumulate token usage from attempt
-        if "token_usage" in attempt:
-            token_data = attempt["token_usage"]
-            cumulative_input_tokens += token_data.get("input_tokens", 0)
-            cumulative_output_tokens += token_data.get("output_tokens", 0)
-            cumulative_cache_creation_tokens += token_data.get("cache_creation_input_tokens", 0)
-            cumulative_cache_read_tokens += token_data.get("cache_read_input_tokens", 0)
+        cumulative_token_usage = summary["cumulative_token_usage"]
+        for key, value in current_attempt.get("token_usage", {}).items():
+            cumulative_token_usage[key] = cumulative_token_usage.get(key, 0) + value
         
-        # Sum the SDK-reported cost from each attempt's ResultMessage (authoritative)
-        if "result_message" in attempt and attempt["result_message"]:
-            cumulative_cost += attempt["result_message"].get("total_cost_usd", 0) or 0
+        # Add the SDK-reported cost from this attempt's ResultMessage (authoritative)
+        result_message = current_attempt.get("result_message")
+        if result_message:
+            cost = result_message.get("total_cost_usd", 0) or 0
+            summary["total_cost_usd"] = round(summary["total_cost_usd"] + cost, 6)
+    
+    summary["total_attempts"] = len(step_logs["attempts"])
+    if validation_result == "success":
+        summary["successful_attempt"] = attempt_num
+    
+    _LOG_DIRTY = True
+    _flush_logs()
+
+
+async def log_message_async(step_name: str, attempt_num: int, message_num: int, message, message_type: str, processed_message_ids: set):
+    """
+    Async variant of log_message for use inside agent sessions.
+    
+    Runs inline on the event loop: a message update is an in-memory change
+    plus at most one O_APPEND write, cheaper than a thread handoff per message.
+    
+    Args:
+        Same as log_message
+    """
+    log_message(step_name, attempt_num, message_num, message, message_type, processed_message_ids)
+
+
+async def mark_attempt_started_async(step_name: str, attempt_num: int) -> Dict:
+    """
+    Async variant of mark_attempt_started for use alongside running agent sessions.
+    
+    Runs inline on the event loop, like log_message_async.
+    
+    Args:
+        Same as mark_attempt_started
         
-        if attempt.get("validation_result") == "success":
-            successful_attempt = idx + 1
-    
-    cumulative_token_usage = {
-        "input_tokens": cumulative_input_tokens,
-        "output_tokens": cumulative_output_tokens,
-        "cache_creation_input_tokens": cumulative_cache_creation_tokens,
-        "cache_read_input_tokens": cumulative_cache_read_tokens
-    }
-    logs[step_name]["cumulative_summary"] = {
-        "total_attempts": len(logs[step_name]["attempts"]),
-        "successful_attempt": successful_attempt,
-        "total_messages": cumulative_messages,
-        "cumulative_token_usage": cumulative_token_usage,
-        "total_cost_usd": round(cumulative_cost, 6)
-    }
+    Returns:
+        The attempt's (in-memory) log entry
+    """
+    return mark_attempt_started(step_name, attempt_num)
+
+
+async def finalize_attempt_log_async(step_name: str, attempt_num: int, validation_result: str, validation_errors: Optional[str] = None):
+    """
+    Async variant of finalize_attempt_log for use inside agent sessions.
+    
+    Finalizing rewrites logging.json, so it runs in a worker thread to keep
+    that serialization and file I/O off the event loop shared by all agents.
     
-    # Write back to file with ensure_ascii=False for readability
-    with open(log_file, 'w') as f:
-        json.dump(logs, f, indent=2, ensure_ascii=False)
+    Args:
+        Same as finalize_attempt_log
+    """
+    await asyncio.to_thread(finalize_attempt_log, step_name, attempt_num, validation_result, validation_errors)
 
 
+def print_banner(title: str, blank_before: bool = False, blank_after: bool = False):
+    """
+    Print a title between two separator lines as a single write.
+    
+    Args:
+        title: Text shown between the separators
+        blank_before: Emit an empty line before the banner
+        blank_after: Emit an empty line after the banner
+    """
+    separator = "=" * BANNER_WIDTH
+    text = f"{separator}\n{title}\n{separator}"
+    if blank_before:
+        text = "\n" + text
+    if blank_after:
+        text += "\n"
+    print(text)
+
+
+@_locked
 def print_usage_summary(step_name: str):
     """
-    Print a summary of message statistics and costs for a step from the log file.
+    Print a summary of message statistics and costs for a step from the cached logs.
     
     Args:
         step_name: Name of the workflow step
     """
-    log_file = STEP_1_LOG_DIR / "logging.json"
-    
-    if not log_file.exists():
-        return
-    
-    with open(log_file, 'r') as f:
-        logs = json.load(f)
+    logs = _get_logs()
     
     if step_name not in logs or "cumulative_summary" not in logs[step_name]:
         return
@@ -0,0 +1,90 @@
+"""
+Partition loading utilities for the extraction workflow.
+
+Provides functions for:
+- Loading all partition files from partitions/
+- Clearing the cached partitions
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PARTITIONS_DIR = Path("partitions")
+
+# Upper bound on threads used to read and parse partition files in parallel
+LOAD_MAX_WORKERS = 8
+
+# Parsed partitions together with the (name, st_mtime_ns, st_size) of every
+# partition file they were parsed from. Partition files are written by agents
+# in other processes, so the cache is validated against the directory on each
+# load instead of being trusted until explicitly cleared.
+_PARTITION_CACHE: Optional[Tuple[Tuple[Tuple[str, int, int], ...], List[Dict]]] = None
+
+
+def _partition_files() -> List[Path]:
+    """
+    Return the partition_*.json files in partitions/, sorted by name.
+    
+    Partition ids are zero-padded, so sorting the plain names gives partition
+    order without building and comparing Path objects.
+    """
+    with os.scandir(PARTITIONS_DIR) as entries:
+        names = [
+            entry.name for entry in entries
+            if entry.name.startswith("partition_") and entry.name.endswith(".json")
+        ]
+    names.sort()
+    return [PARTITIONS_DIR / name for name in names]
+
+
+def _load_partition(file_path: Path) -> Dict:
+    """Parse one partition file, recording where it was loaded from."""
+    data = json.loads(file_path.read_bytes())
+    data["_file_path"] = str(file_path)
+    return data
+
+
+def get_all_partitions() -> List[Dict]:
+    """
+    Get list of all partition files with their data.
+    
+    Partitions are parsed once and reused while no partition file has been
+    added, removed or modified, so repeated calls cost a directory listing and
+    one stat() per file. The partition dicts are shared with the cache and
+    must not be modified by callers.
+    
+    Returns:
+        List of partition dictionaries with partition_id, title, paths, etc.
+    """
+    global _PARTITION_CACHE
+    
+    if not PARTITIONS_DIR.exists():
+        return []
+    
+    file_paths = _partition_files()
+    fingerprint = []
+    for file_path in file_paths:
+        stat = os.stat(file_path)
+        fingerprint.append((file_path.name, stat.st_mtime_ns, stat.st_size))
+    fingerprint = tuple(fingerprint)
+    
+    if _PARTITION_CACHE is not None and _PARTITION_CACHE[0] == fingerprint:
+        return list(_PARTITION_CACHE[1])
+    
+    # Files are independent, so overlap their reads; map() keeps sorted order
+    if len(file_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(LOAD_MAX_WORKERS, len(file_paths))) as executor:
+            partitions = list(executor.map(_load_partition, file_paths))
+    else:
+        partitions = [_load_partition(file_path) for file_path in file_paths]
+    _PARTITION_CACHE = (fingerprint, partitions)
+    return list(partitions)
+
+
+def clear_partition_cache():
+    """Drop the cached partitions so the next load re-reads partitions/."""
+    global _PARTITION_CACHE
+    _PARTITION_CACHE = None
@@ -0,0 +1,67 @@
+"""
+Event loop utilities for the extraction workflow.
+
+Provides functions for:
+- Running coroutines on one event loop shared by every workflow step
+- Closing the shared event loop
+"""
+
+import asyncio
+import atexit
+from typing import Optional
+
+# Event loop shared by all steps in this process, created on first use
+_EVENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared event loop, creating it on first use.
+    
+    Unlike asyncio.run(), which builds and tears down a loop (and its default
+    thread pool) per call, every step runs on this one loop.
+    """
+    global _EVENT_LOOP
+    
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        _EVENT_LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_EVENT_LOOP)
+    return _EVENT_LOOP
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on the shared event loop.
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    return get_event_loop().run_until_complete(coro)
+
+
+def close_event_loop():
+    """Shut down and close the shared event loop, if one was created."""
+    global _EVENT_LOOP
+    
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        return
+    
+    try:
+        # Like asyncio.run(), cancel tasks a failed step left behind
+        pending = asyncio.all_tasks(_EVENT_LOOP)
+        for task in pending:
+            task.cancel()
+        _EVENT_LOOP.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        _EVENT_LOOP.run_until_complete(_EVENT_LOOP.shutdown_asyncgens())
+        _EVENT_LOOP.run_until_complete(_EVENT_LOOP.shutdown_default_executor())
+    finally:
+        asyncio.set_event_loop(None)
+        _EVENT_LOOP.close()
+        _EVENT_LOOP = None
+
+
+# Steps may be called directly rather than through start_extraction.main()
+atexit.register(close_event_loop)
@@ -6,11 +6,12 @@ Modules:
     - ontology_prompts: Prompts for ontology creation
 """
 
-from .partition_prompts import build_partition_creation_prompt
+from .partition_prompts import build_partition_creation_prompt, build_partition_retry_prompt
 from .ontology_prompts import build_ontology_creation_prompt
 
 __all__ = [
     "build_partition_creation_prompt",
+    "build_partition_retry_prompt",
     "build_ontology_creation_prompt",
 ]
 
@@ -4,49 +4,33 @@ Prompt templates for ontology creation.
 Provides the prompt for Claude to create entity and relationship ontologies for partitions.
 """
 
+from itertools import islice
+from string import Template
 from typing import Dict
 
+# Number of partition files listed in the prompt before the "... and N more" line
+FILE_PREVIEW_LIMIT = 10
 
-def build_ontology_creation_prompt(partition: Dict, data_source_path: str, item_id: str) -> str:
-    """
-    Build the user message prompt for Claude to create ontologies for a partition.
-    
-    Args:
-        partition: The partition data dictionary
-        data_source_path: Path to the data source directory
-        item_id: The checklist item ID for this partition (e.g., "2.1")
-        
-    Returns:
-        Formatted prompt string
-    """
-    partition_id = partition.get("partition_id")
-    title = partition.get("title", "Unknown")
-    description = partition.get("description", "")
-    paths = partition.get("paths", [])
-    file_count = len(paths)
-    
-    # Build file list preview (first 10 files)
-    file_preview = "\n".join([f"  - {p}" for p in paths[:10]])
-    if len(paths) > 10:
-        file_preview += f"\n  ... and {len(paths) - 10} more files"
-    
-    prompt = f"""I'm building a Knowledge Graph from {data_source_path}. You are assigned to create ontologies for **Partition {partition_id}**.
+
+# Ontology creation prompt. The scaffold is parsed once at import and filled
+# with Template.substitute per partition ($-placeholders leave JSON braces literal).
+ONTOLOGY_CREATION_PROMPT_TEMPLATE = Template("""I'm building a Knowledge Graph from $data_source_path. You are assigned to create ontologies for **Partition $partition_id**.
 
 ## Your Partition Assignment
 
-**Partition {partition_id}: {title}**
-- Description: {description}
-- Files: {file_count} files
+**Partition $partition_id: $title**
+- Description: $description
+- Files: $file_count files
 - File list preview:
-{file_preview}
+$file_preview
 
 ## Success Pattern (Follow These Steps)
 
-1. **Review Partition**: Read `partitions/partition_{partition_id:02d}.json` to understand all files in your partition
+1. **Review Partition**: Read `partitions/partition_$partition_id_padded.json` to understand all files in your partition
 2. **Analyze Files**: Read several representative files to understand the content, entities, and relationships present
-3. **Create Entity Ontology**: For each distinct entity TYPE you identify, run:
+3. **Create Entity Ontology**: Create all distinct entity TYPEs you identify in one batch:
    ```bash
-   python scripts/create_entity.py "<entity_type>" "<description>" "<example_file>" "<example_in_file>"
+   echo '[{"type": "<entity_type>", "description": "<description>", "example_file": "<example_file>", "example_in_file": "<example_in_file>"}, ...]' | python scripts/create_entities_batch.py
    ```
 4. **Create Relationship Ontology**: For each distinct relationship TYPE you identify, run:
    ```bash
@@ -54,13 +38,13 @@ def build_ontology_creation_prompt(partition: Dict, data_source_path: str, item_
    ```
 5. **Mark Subtask Complete**: After creating ALL entities and relationships for the partition:
    ```bash
-   python scripts/mark_subtask.py {item_id} {item_id}.1
+   python scripts/mark_subtask.py $item_id $item_id.1
    ```
-6. **Verify Each File**: For each file subtask (2.X.2 through 2.X.N), verify entities/relationships are captured:
+6. **Verify Each File**: For each file subtask (2.X.2 through 2.X.N), verify entities/relationships are captured, then mark the verified subtasks together:
    ```bash
-   python scripts/mark_subtask.py {item_id} {item_id}.<subtask_num>
+   python scripts/mark_subtasks_batch.py $item_id $item_id.<subtask_num> [$item_id.<subtask_num> ...]
    ```
-7. **Final Check**: Run `python scripts/all_subtasks_done.py {item_id}` to verify completion
+7. **Final Check**: Run `python scripts/all_subtasks_done.py $item_id` to verify completion
 8. **Complete**: Respond without tools when all subtasks are done
 
 
@@ -82,18 +66,18 @@ Create a **COMPLETE** entity and relationship ontology for this partition that:
 
 **Entity Example** (from examples/ontology_example/example_entity_ontology.json):
 ```json
-{{
+{
   "entity_id": "1",
   "type": "Red Hat Product",
   "example_file": "data/rosa-kcs/kcs_solutions/example.md",
   "description": "A Red Hat product involved in the given KCS article.",
   "example_in_file": "Openshift Container Platform 4"
-}}
+}
 ```
 
 **Relationship Example** (from examples/ontology_example/example_relationship_ontology.json):
 ```json
-{{
+{
   "relationship_id": "1",
   "type": "DOCUMENTS",
   "source_entity_type": "KCS Article",
@@ -101,24 +85,30 @@ Create a **COMPLETE** entity and relationship ontology for this partition that:
   "description": "Indicates that a KCS Article documents troubleshooting steps for a Red Hat Product.",
   "example_file": "data/rosa-kcs/kcs_solutions/example.md",
   "example_in_file": "KCS 5682881 -> DOCUMENTS -> Openshift Container Platform 4"
-}}
+}
 ```
 
 
 ## Available Commands
 
 ```bash
-# Create an entity in the master ontology
+# Create several entities in the master ontology (preferred: one call per batch)
+echo '[{"type": ..., "description": ..., "example_file": ..., "example_in_file": ...}, ...]' | python scripts/create_entities_batch.py
+
+# Create a single entity in the master ontology
 python scripts/create_entity.py "<type>" "<description>" "<example_file>" "<example_in_file>"
 
 # Create a relationship in the master ontology  
 python scripts/create_relationship.py "<type>" "<source_entity_type>" "<target_entity_type>" "<description>" "<example_file>" "<example_in_file>"
 
-# Mark a subtask as complete
-python scripts/mark_subtask.py {item_id} <subtask_item_id>
+# Mark several subtasks as complete (preferred: one call per batch)
+python scripts/mark_subtasks_batch.py $item_id <subtask_item_id> [<subtask_item_id> ...]
+
+# Mark a single subtask as complete
+python scripts/mark_subtask.py $item_id <subtask_item_id>
 
 # Check if all subtasks are done
-python scripts/all_subtasks_done.py {item_id}
+python scripts/all_subtasks_done.py $item_id
 
 # View current entity ontology
 cat ontology/master_entity_ontology.json
@@ -130,8 +120,43 @@ cat ontology/master_relationship_ontology.json
 
 ## Environment Variable
 
-Your PARTITION_ITEM_ID is set to `{item_id}`. This allows scripts to know which partition you're working on.
+Your PARTITION_ITEM_ID is set to `$item_id`. This allows scripts to know which partition you're working on.
 
 Begin by reading the partition file and a few representative data files to understand the content.
-"""
-    return prompt
+""")
+
+
+def build_ontology_creation_prompt(partition: Dict, data_source_path: str, item_id: str) -> str:
+    """
+    Build the user message prompt for Claude to create ontologies for a partition.
+    
+    Args:
+        partition: The partition data dictionary
+        data_source_path: Path to the data source directory
+        item_id: The checklist item ID for this partition (e.g., "2.1")
+        
+    Returns:
+        Formatted prompt string
+    """
+    partition_id = partition.get("partition_id")
+    title = partition.get("title", "Unknown")
+    description = partition.get("description", "")
+    paths = partition.get("paths", [])
+    file_count = len(paths)
+    
+    # Build file list preview (first FILE_PREVIEW_LIMIT files) without copying
+    # the head of a potentially very long path list
+    file_preview = "\n".join(f"  - {p}" for p in islice(paths, FILE_PREVIEW_LIMIT))
+    if file_count > FILE_PREVIEW_LIMIT:
+        file_preview += f"\n  ... and {file_count - FILE_PREVIEW_LIMIT} more files"
+    
+    return ONTOLOGY_CREATION_PROMPT_TEMPLATE.substitute(
+        data_source_path=data_source_path,
+        partition_id=partition_id,
+        partition_id_padded=f"{partition_id:02d}",
+        title=title,
+        description=description,
+        file_count=file_count,
+        file_preview=file_preview,
+        item_id=item_id,
+    )
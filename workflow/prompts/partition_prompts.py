@@ -1,76 +1,137 @@
 """
 Prompt templates for partition creation.
 
-Provides the prompt for Claude to create file subsets from a data source.
+Provides the prompt for Claude to create file subsets from a data source,
+and the section appended to it when the created file subsets fail validation.
 """
 
-from typing import List
+from functools import lru_cache
+from string import Template
+from typing import List, Tuple
 
 
-def build_partition_creation_prompt(data_source: str, data_source_path: str, special_commands: List[str], example_partition_path: str = "examples/partition_example") -> str:
-    """
-    Build the user message prompt for Claude to create file subsets for a single data source.
-    
-    Args:
-        data_source: Name of the data source (e.g., "openshift-docs")
-        data_source_path: Full path to the data source directory (e.g., "data/openshift-docs")
-        special_commands: List of make commands available to the agent
-        example_partition_path: Path to example partition structure
-        
-    Returns:
-        Formatted prompt string
-    """
-    # Format special commands for display
-    commands_list = "\n".join([f"  - `{cmd}`" for cmd in special_commands])
-    
-    prompt = f"""I'm building a Knowledge Graph from {data_source_path}. Your cwd is the project root. Key directories: `data/` and `scripts/`.
+# Agent commands referenced by both partition prompts, kept in one place so the
+# creation and retry prompts cannot drift apart
+CREATE_FILE_SUBSET_USAGE = 'python3 scripts/create_file_subset.py "<data_source>" "<title>" "<description>" <path1> [path2] ...'
+VALIDATE_PARTITION_COMMAND = "python3 scripts/validate_partition.py"
+
+
+# Initial file subset creation prompt, parsed once at import and filled with
+# Template.substitute per data source.
+PARTITION_CREATION_PROMPT_TEMPLATE = Template("""I'm building a Knowledge Graph from $data_source_path. Your cwd is the project root. Key directories: `data/` and `scripts/`.
 
 
 ## Your Task
-Create file subsets for all files in {data_source_path}. 
+Create file subsets for all files in $data_source_path. 
 - **Each file must appear in exactly one file subset** (no duplicates, no missing files)
-- **Do NOT modify {data_source_path}** — it is read-only
+- **Do NOT modify $data_source_path** — it is read-only
 
 
 ## Success Pattern (Follow These Steps)
-1. **Explore**: Run `find {data_source_path} -type f | wc -l` and `find {data_source_path} -type d | sort` to understand file count and structure
+1. **Explore**: Run `find $data_source_path -type f | wc -l` and `find $data_source_path -type d | sort` to understand file count and structure
 2. **Plan**: Create scratch files in `/tmp/` to track which files go in each file subset title. 
     - Single file subset is not allowed - there must be multiple file subsets. Use the commands below to create them.
-    - The file subsets should be disjoint and cover all files in {data_source_path}.
-3. **Create**: Run `python3 scripts/create_file_subset.py "<data_source>" "<title>" "<description>" <path1> [path2] ...` for each file subset
-4. **Validate**: Run `python3 scripts/validate_partition.py {data_source}`
+    - The file subsets should be disjoint and cover all files in $data_source_path.
+3. **Create**: Run `$create_file_subset_usage` for each file subset
+4. **Validate**: Run `$validate_command`
 5. **Complete**: Respond without tools when validation passes
 
 
 ## Available Commands
 You have access to a **bash tool** that allows you to execute shell commands. Use ONLY these commands:
-{commands_list}
+$commands_list
 
 
 ## How to Create File Subsets
 ```bash
-python3 scripts/create_file_subset.py "<data_source>" "<title>" "<description>" <path1> [path2] ...
+$create_file_subset_usage
 ```
 
 **Arguments:**
-- `<data_source>`: The data source name (ALWAYS use "{data_source}")
+- `<data_source>`: The data source name (ALWAYS use "$data_source")
 - `<title>`: Concise label (≤8 words) describing the file subset's content
 - `<description>`: 2-3 sentences describing the files and their common characteristics
-- `<paths>`: File/directory paths relative to {data_source_path}
+- `<paths>`: File/directory paths relative to $data_source_path
 
-**Path notation (paths are relative to {data_source_path}):**
+**Path notation (paths are relative to $data_source_path):**
 - Directory: `"subfolder/"` = ALL files in that directory
 - Specific file: `"subfolder/file.md"` = single file
 - Top-level files: `"file.md"`
 
-**DO NOT include `{data_source_path}` in PATHS - it's automatically prepended**
+**DO NOT include `$data_source_path` in PATHS - it's automatically prepended**
 
-File subsets are saved to `partitions/{data_source}/file_subset_XX.json`
+File subsets are saved to `partitions/$data_source/file_subset_XX.json`
 
 
 ## Example File Subset Creation
-If needed, `{example_partition_path}/README.md` outlines an example scenario for a data source and the commands to create file subsets for it.
+If needed, `$example_partition_path/README.md` outlines an example scenario for a data source and the commands to create file subsets for it.
 
 Complete the steps of "## Success Pattern" above.
-"""
-    return prompt
+""")
+
+
+# Section appended to the unchanged creation prompt after a failed validation.
+# The creation prompt stays a byte-stable prefix across retries, so only this
+# short delta (essentially the error text) differs between attempts.
+PARTITION_RETRY_PROMPT_TEMPLATE = Template("""
+
+## Prior Attempt Failed
+File subsets from a previous attempt are already in partitions/$data_source/ and have validation errors:
+
+$error_message
+
+Fix the validation errors above: delete the problematic file subset files in partitions/$data_source/, create corrected ones as described above, and make sure every file in $data_source_path is covered exactly once. Run `$validate_command` to verify. Keep the rest of the instructions.
+""")
+
+
+@lru_cache(maxsize=8)
+def _format_commands_list(special_commands: Tuple[str, ...]) -> str:
+    """Format special commands as a bulleted list; computed once per command set."""
+    return "\n".join(f"  - `{cmd}`" for cmd in special_commands)
+
+
+def build_partition_creation_prompt(data_source: str, data_source_path: str, special_commands: List[str], example_partition_path: str = "examples/partition_example") -> str:
+    """
+    Build the user message prompt for Claude to create file subsets for a single data source.
+    
+    Args:
+        data_source: Name of the data source (e.g., "openshift-docs")
+        data_source_path: Full path to the data source directory (e.g., "data/openshift-docs")
+        special_commands: List of make commands available to the agent
+        example_partition_path: Path to example partition structure
+        
+    Returns:
+        Formatted prompt string
+    """
+    return PARTITION_CREATION_PROMPT_TEMPLATE.substitute(
+        data_source=data_source,
+        data_source_path=data_source_path,
+        commands_list=_format_commands_list(tuple(special_commands)),
+        example_partition_path=example_partition_path,
+        create_file_subset_usage=CREATE_FILE_SUBSET_USAGE,
+        validate_command=f"{VALIDATE_PARTITION_COMMAND} {data_source}",
+    )
+
+
+def build_partition_retry_prompt(data_source: str, data_source_path: str, error_message: str) -> str:
+    """
+    Build the section appended to the creation prompt after file subset validation fails.
+    
+    Retries resend the original creation prompt followed by this section, so
+    the agent's fresh session keeps the full instructions and the prompt
+    prefix is identical across attempts.
+    
+    Args:
+        data_source: Name of the data source (e.g., "openshift-docs")
+        data_source_path: Full path to the data source directory (e.g., "data/openshift-docs")
+        error_message: Validation error text from validate_and_get_errors
+        
+    Returns:
+        Formatted section to append to the creation prompt
+    """
+    return PARTITION_RETRY_PROMPT_TEMPLATE.substitute(
+        data_source=data_source,
+        data_source_path=data_source_path,
+        error_message=error_message,
+        validate_command=f"{VALIDATE_PARTITION_COMMAND} {data_source}",
+    )
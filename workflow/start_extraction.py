@@ -9,16 +9,19 @@ This script:
 3. Invokes Claude Code Agent SDK with appropriate prompts and tools
 4. Implements validation loop for partition creation
 
-Usage:
-    python -m workflow.start_extraction
+Usage (from the project root; the module uses package-relative imports):
+    python -m workflow.start_extraction [--force]
     
-    Or from project root:
-    python workflow/start_extraction.py
+    Or:
+    make start-extraction [FORCE=1]
+
+Step 3 resumes an interrupted earlier run for the same partitions; --force
+recreates the ontologies from scratch instead.
 """
 
+import argparse
 import sys
-from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 from dotenv import load_dotenv
 
@@ -34,21 +37,20 @@ from .helpers import (
     reset_checklist,
     reset_logging,
     mark_master_checklist_step_complete,
-)
-from .steps import (
-    step_1_create_file_partitions,
-    step_3_create_ontologies_for_each_partition,
+    print_banner,
+    BANNER_WIDTH,
 )
 
 
 def show_workflow_status(config: Dict):
     """Display current workflow status"""
-    print("\n" + "=" * 60)
-    print("EXTRACTION WORKFLOW STATUS")
-    print("=" * 60)
-    print()
-    print("Configuration:")
-    print("  " + "─" * 56)
+    print_banner("EXTRACTION WORKFLOW STATUS", blank_before=True, blank_after=True)
+    
+    # Table rule indented by two spaces, ending flush with the banner
+    lines = [
+        "Configuration:",
+        "  " + "─" * (BANNER_WIDTH - 4),
+    ]
     
     # Flag display names and their corresponding step numbers
     flag_info = {
@@ -59,19 +61,32 @@ def show_workflow_status(config: Dict):
     for key, value in config.items():
         display_name, step_num = flag_info.get(key, (key, "??"))
         status = "--SKIP--" if value else f"Step {step_num}"
-        print(f"  {display_name:30s} {status}")
-    print()
+        lines.append(f"  {display_name:30s} {status}")
+    lines.append("")
+    
+    # One print for the whole table
+    print("\n".join(lines))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Run the KG extraction workflow")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recreate ontologies from scratch instead of resuming a previous step 3 run"
+    )
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main workflow orchestration"""
+    args = parse_args(argv)
+    
     # ========================================================================
     # RESET: Reset all workflow artifacts at the beginning
     # ========================================================================
-    print("\n" + "=" * 60)
-    print("INITIALIZING EXTRACTION WORKFLOW")
-    print("=" * 60)
-    print()
+    print_banner("INITIALIZING EXTRACTION WORKFLOW", blank_before=True, blank_after=True)
     
     # Reset the logging file for a fresh start
     reset_logging()
@@ -105,8 +120,11 @@ def main():
         return 0
     
     # Execute Step 1: Create file partitions
+    # Step modules are imported only when the step runs: they pull in the
+    # Claude Agent SDK, which a run that skips every step never needs
     if step_1:
         print("→ Executing: Step 1 - Create file partitions")
+        from .steps.step_1_partitions import step_1_create_file_partitions
         success = step_1_create_file_partitions()
         if not success:
             print("\n❌ Failed to create valid partitions.")
@@ -121,7 +139,9 @@ def main():
     # Execute Step 3: Create ontologies for each partition
     if step_3:
         print("→ Executing: Step 3 - Create ontologies for each partition")
-        success = step_3_create_ontologies_for_each_partition()
+        from .steps.step_3_review_ontologies import step_3_create_ontologies_for_each_partition
+        # Progress from an earlier run only carries over if partitions were kept
+        success = step_3_create_ontologies_for_each_partition(force=args.force or step_1)
         if not success:
             print("\n❌ Failed to create ontologies.")
             return 1
@@ -135,13 +155,5 @@ def main():
 
 
 if __name__ == "__main__":
-    # When running as a script, ensure the parent directory is in the path
-    # so that relative imports work correctly
-    script_dir = Path(__file__).parent.parent
-    if str(script_dir) not in sys.path:
-        sys.path.insert(0, str(script_dir))
-    
-    # Re-import with proper path
-    from workflow.start_extraction import main as run_main
-    sys.exit(run_main())
+    sys.exit(main())
 
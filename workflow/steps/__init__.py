@@ -3,22 +3,33 @@ Workflow step implementations.
 
 Modules:
     - step_1_partitions: Create file partitions from data source
-    - step_3_ontologies: Create ontologies for each partition
+    - step_3_review_ontologies: Create ontologies for each partition
+
+Step modules pull in the Claude Agent SDK, so they are imported lazily on
+first attribute access rather than when the package is imported.
 """
 
-from .step_1_partitions import step_1_create_file_partitions
-from .step_3_ontologies import (
-    step_3_create_ontologies_for_each_partition,
-    get_all_partitions,
-    generate_ontology_checklist,
-    init_partition_ontologies,
-)
-
-__all__ = [
-    "step_1_create_file_partitions",
-    "step_3_create_ontologies_for_each_partition",
-    "get_all_partitions",
-    "generate_ontology_checklist",
-    "init_partition_ontologies",
-]
+from importlib import import_module
+
+from ..helpers.partitions import get_all_partitions
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "step_1_create_file_partitions": ".step_1_partitions",
+    "step_3_create_ontologies_for_each_partition": ".step_3_review_ontologies",
+    "generate_ontology_checklist": ".step_3_review_ontologies",
+    "init_master_ontologies": ".step_3_review_ontologies",
+}
+
+__all__ = ["get_all_partitions", *_EXPORTS]
+
 
+def __getattr__(name: str):
+    """Import the submodule defining name on first access (PEP 562)."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
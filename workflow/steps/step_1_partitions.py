@@ -8,21 +8,55 @@ This module handles the partition creation workflow step, which:
 4. Validates the partitions with a retry loop
 """
 
-import sys
-import json
 import asyncio
-from datetime import datetime, timezone
-from pathlib import Path
+import hashlib
+import os
+from collections import deque
+from typing import Deque, Optional
 
-from ..helpers.logging import log_prompt_to_file, finalize_attempt_log, print_usage_summary, STEP_1_LOG_DIR
+from scripts.validate_partition import validate_and_get_errors
+
+from ..helpers.logging import (
+    log_prompt_to_file,
+    mark_attempt_started_async,
+    finalize_attempt_log_async,
+    print_banner,
+    print_usage_summary,
+)
 from ..helpers.config import get_data_source_path, get_data_sources
 from ..helpers.checklist import load_checklist, reset_checklist, mark_checklist_item_complete
 from ..helpers.filesystem import reset_partitions_folder
-from ..prompts.partition_prompts import build_partition_creation_prompt
+from ..helpers.runtime import run_async
+from ..prompts.partition_prompts import build_partition_creation_prompt, build_partition_retry_prompt
 from ..agents.partition_agent import run_partition_creation_attempt
 
+# Consecutive byte-identical failures (of the same kind) after which further
+# retries are abandoned; kept below max_attempts so it can actually save one
+MAX_IDENTICAL_FAILURES = 2
+
+# Attempt log error prefix for attempts abandoned by the circuit breaker
+CIRCUIT_BREAKER_STATUS = "circuit-breaker: no progress"
+
+# Data sources partitioned at once (one agent session each)
+PARTITION_PARALLELISM = int(os.environ.get("KARTO_PARTITION_PARALLELISM", "4"))
+
+
+def _record_failure(recent_failures: Deque[bytes], error: Optional[str]) -> bool:
+    """
+    Record a failed attempt's error and check whether the agent is stuck.
+    
+    Args:
+        recent_failures: Digests of the most recent failures (bounded deque)
+        error: Error message of the failed attempt
+        
+    Returns:
+        True if the last MAX_IDENTICAL_FAILURES failures all had the same error
+    """
+    recent_failures.append(hashlib.blake2b(str(error).encode("utf-8"), digest_size=8).digest())
+    return len(recent_failures) == MAX_IDENTICAL_FAILURES and len(set(recent_failures)) == 1
+
 
-def run_partition_agent_for_data_source(
+async def run_partition_agent_for_data_source(
     data_source: str,
     data_source_path: str,
     special_commands: list,
@@ -31,6 +65,9 @@ def run_partition_agent_for_data_source(
     """
     Run the partition creation agent for a single data source.
     
+    Data sources are independent, so step 1 runs this coroutine for several
+    of them concurrently; blocking work (validation) runs in a worker thread.
+    
     Args:
         data_source: Name of the data source (e.g., "openshift-docs")
         data_source_path: Full path to the data source (e.g., "data/openshift-docs")
@@ -40,21 +77,17 @@ def run_partition_agent_for_data_source(
     Returns:
         True if partitions were created successfully for this data source
     """
-    # Import validation function
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
-    from validate_partition import validate_and_get_errors
-    
-    # Build the initial prompt for this data source
-    user_message = build_partition_creation_prompt(data_source, data_source_path, special_commands)
+    # Build the initial prompt for this data source. Retries resend it unchanged
+    # with a short failure section appended, keeping the prompt prefix stable.
+    creation_prompt = build_partition_creation_prompt(data_source, data_source_path, special_commands)
+    user_message = creation_prompt
     
     # Log the initial prompt to a text file (file_partition_{data_source}_prompt.txt)
-    log_prompt_to_file(data_source, user_message)
+    log_prompt_to_file(data_source, creation_prompt)
     
     step_name = f"step_1.1_file_subsets_{data_source}"
     
-    print("=" * 60)
-    print(f"STEP 1.1: Creating File Subsets for '{data_source}'")
-    print("=" * 60)
+    print_banner(f"STEP 1.1: Creating File Subsets for '{data_source}'")
     print(f"Data path: {data_source_path}")
     print(f"Special commands: {', '.join(special_commands)}")
     print()
@@ -64,50 +97,51 @@ def run_partition_agent_for_data_source(
     
     attempt = 0
     
+    # Agent errors and validation errors are tracked separately: only repeats
+    # of the same kind of failure in a row mean the agent is stuck
+    agent_failures = deque(maxlen=MAX_IDENTICAL_FAILURES)
+    validation_failures = deque(maxlen=MAX_IDENTICAL_FAILURES)
+    
+    # Reused across retries so validation only re-parses file subsets the agent changed
+    validation_cache = {}
+    
     # Main retry loop
     while attempt < max_attempts:
         attempt += 1
-        print(f"\n{'='*60}")
-        print(f"Attempt {attempt}/{max_attempts} for '{data_source}'")
-        print(f"{'='*60}\n")
+        print_banner(f"Attempt {attempt}/{max_attempts} for '{data_source}'", blank_before=True, blank_after=True)
         
         # Set started timestamp
-        log_file = STEP_1_LOG_DIR / "logging.json"
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                logs = json.load(f)
-            if step_name in logs:
-                attempts = logs[step_name]["attempts"]
-                if len(attempts) >= attempt and attempts[attempt - 1]["started_at"] is None:
-                    attempts[attempt - 1]["started_at"] = datetime.now(timezone.utc).isoformat()
-                    with open(log_file, 'w') as f:
-                        json.dump(logs, f, indent=2)
+        await mark_attempt_started_async(step_name, attempt)
         
         # Run the partition creation attempt
-        success, error = asyncio.run(run_partition_creation_attempt(user_message, step_name, attempt))
+        success, error = await run_partition_creation_attempt(user_message, step_name, attempt)
         
         if not success:
-            finalize_attempt_log(step_name, attempt, "failed", error)
+            validation_failures.clear()
+            stuck = _record_failure(agent_failures, error)
+            await finalize_attempt_log_async(
+                step_name, attempt, "failed",
+                f"{CIRCUIT_BREAKER_STATUS}\n\n{error}" if stuck else error
+            )
             print(f"\n❌ Attempt {attempt} failed: {error}")
+            if stuck:
+                print(f"\n❌ No progress: last {MAX_IDENTICAL_FAILURES} attempts for '{data_source}' failed identically.")
+                return False
             if attempt < max_attempts:
                 print(f"🔄 Will retry...")
             continue
         
         # Validate the file subsets for this data source
-        print(f"\n{'='*60}")
-        print(f"Validating File Subsets for '{data_source}'...")
-        print(f"{'='*60}\n")
+        print_banner(f"Validating File Subsets for '{data_source}'...", blank_before=True, blank_after=True)
         
-        is_valid, error_message = validate_and_get_errors(data_source)
+        is_valid, error_message = await asyncio.to_thread(validate_and_get_errors, data_source, validation_cache)
         
         if is_valid:
             # Log successful attempt
-            finalize_attempt_log(step_name, attempt, "success")
+            await finalize_attempt_log_async(step_name, attempt, "success")
             
             # Show message summary
-            print(f"\n{'='*60}")
-            print(f"📊 Session Summary for '{data_source}'")
-            print(f"{'='*60}")
+            print_banner(f"📊 Session Summary for '{data_source}'", blank_before=True)
             print_usage_summary(step_name)
             
             print(f"✅ VALIDATION PASSED for '{data_source}'!")
@@ -115,42 +149,32 @@ def run_partition_agent_for_data_source(
             return True
         else:
             # Log failed attempt
-            finalize_attempt_log(step_name, attempt, "failed", error_message)
+            agent_failures.clear()
+            stuck = _record_failure(validation_failures, error_message)
+            await finalize_attempt_log_async(
+                step_name, attempt, "failed",
+                f"{CIRCUIT_BREAKER_STATUS}\n\n{error_message}" if stuck else error_message
+            )
             
             # Show message summary for this attempt
-            print(f"\n{'='*60}")
-            print(f"📊 Session Summary for '{data_source}'")
-            print(f"{'='*60}")
+            print_banner(f"📊 Session Summary for '{data_source}'", blank_before=True)
             print_usage_summary(step_name)
             
             print("❌ VALIDATION FAILED!")
             print("\nErrors found:")
             print(error_message)
             
+            if stuck:
+                print(f"\n❌ No progress: last {MAX_IDENTICAL_FAILURES} attempts for '{data_source}' failed with identical errors.")
+                print("Please review the errors and create file subsets manually.")
+                return False
+            
             if attempt < max_attempts:
                 print(f"\n🔄 Retrying... (Attempt {attempt + 1}/{max_attempts})")
                 print("Sending error feedback to Claude agent...")
                 
-                # Update user message with error feedback for next iteration
-                user_message = f"""The file subsets you created have validation errors. Please fix them.
-
-VALIDATION ERRORS:
-{error_message}
-
-Please:
-1. Review the errors above
-2. Delete the problematic file subset files in partitions/{data_source}/ directory
-3. Create corrected file subsets using: python3 scripts/create_file_subset.py "{data_source}" "<title>" "<description>" <paths>
-4. Ensure complete and disjoint coverage of all files in {data_source_path}
-
-Remember:
-- Each file must appear in exactly ONE file subset (no duplicates)
-- ALL files must be covered (no missing files)
-- Use "path/to/directory/" (with trailing slash) to include all files in a directory
-- Paths are relative to {data_source_path} (do NOT include "{data_source}/" prefix in paths)
-
-Once you've fixed the issues, run `python3 scripts/validate_partition.py {data_source}` to verify.
-"""
+                # Append the error feedback to the original prompt for the next iteration
+                user_message = creation_prompt + build_partition_retry_prompt(data_source, data_source_path, error_message)
             else:
                 print(f"\n❌ Maximum attempts ({max_attempts}) reached for '{data_source}'.")
                 print("Please review the errors and create file subsets manually.")
@@ -175,10 +199,7 @@ def step_1_create_file_partitions() -> bool:
     # ========================================================================
     # RESET: Clear existing partitions and checklist before starting
     # ========================================================================
-    print("\n" + "=" * 60)
-    print("RESETTING STEP 1 ARTIFACTS")
-    print("=" * 60)
-    print()
+    print_banner("RESETTING STEP 1 ARTIFACTS", blank_before=True, blank_after=True)
     
     # Remove existing partitions (only when we're recreating them)
     reset_partitions_folder()
@@ -201,37 +222,46 @@ def step_1_create_file_partitions() -> bool:
     step_1_1 = checklist["items"][0]  # First item is 1.1
     special_commands = step_1_1.get("special_commands", [])
     
-    print("=" * 60)
-    print("STEP 1.1: Creating File Subsets")
-    print("=" * 60)
+    print_banner("STEP 1.1: Creating File Subsets")
     print(f"Base data path: {base_data_path}")
     print(f"Data sources to process: {', '.join(data_sources)}")
     print(f"Special commands: {', '.join(special_commands)}")
     print()
     
-    # Process each data source sequentially
-    all_success = True
-    for idx, data_source in enumerate(data_sources, 1):
-        print(f"\n{'#'*60}")
-        print(f"# Processing data source {idx}/{len(data_sources)}: {data_source}")
-        print(f"{'#'*60}\n")
+    # Data sources are independent, so their agents run concurrently (at most
+    # PARTITION_PARALLELISM at once): wall time is the slowest source, not the sum
+    async def run_all_data_sources():
+        """Run every data source's agent, at most PARTITION_PARALLELISM at once."""
+        # Created inside the coroutine so it belongs to the loop that runs it
+        semaphore = asyncio.Semaphore(PARTITION_PARALLELISM)
         
-        data_source_path = f"{base_data_path}/{data_source}"
+        async def run_bounded(data_source: str) -> bool:
+            async with semaphore:
+                return await run_partition_agent_for_data_source(
+                    data_source=data_source,
+                    data_source_path=f"{base_data_path}/{data_source}",
+                    special_commands=special_commands,
+                    max_attempts=3
+                )
         
-        success = run_partition_agent_for_data_source(
-            data_source=data_source,
-            data_source_path=data_source_path,
-            special_commands=special_commands,
-            max_attempts=3
+        return await asyncio.gather(
+            *(run_bounded(data_source) for data_source in data_sources),
+            return_exceptions=True
         )
-        
-        if not success:
+    
+    print(f"Processing {len(data_sources)} data source(s), up to {PARTITION_PARALLELISM} at a time")
+    results = run_async(run_all_data_sources())
+    
+    all_success = True
+    for data_source, result in zip(data_sources, results):
+        if isinstance(result, BaseException):
+            print(f"\n❌ Failed to create file subsets for '{data_source}': {result}")
+            all_success = False
+        elif not result:
             print(f"\n❌ Failed to create file subsets for '{data_source}'")
             all_success = False
-            # Continue to next data source instead of stopping
-            continue
-        
-        print(f"\n✅ Successfully created file subsets for '{data_source}'")
+        else:
+            print(f"\n✅ Successfully created file subsets for '{data_source}'")
     
     if all_success:
         # Mark checklist item 1.1 as complete
@@ -239,13 +269,9 @@ def step_1_create_file_partitions() -> bool:
         mark_checklist_item_complete("01_create_file_partitions", "1.1")
         print()
         
-        print(f"\n{'='*60}")
-        print("PROCEEDING TO STEP 2.1: Create Ontologies")
-        print(f"{'='*60}\n")
+        print_banner("PROCEEDING TO STEP 2.1: Create Ontologies", blank_before=True, blank_after=True)
         return True
     else:
-        print(f"\n{'='*60}")
-        print("❌ Some data sources failed file subset creation")
-        print(f"{'='*60}\n")
+        print_banner("❌ Some data sources failed file subset creation", blank_before=True, blank_after=True)
         return False
 
@@ -9,38 +9,27 @@ This module handles the ontology creation workflow step, which:
 5. Waits for all agents to complete
 """
 
-import json
+import os
 import asyncio
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from ..helpers.logging import print_usage_summary
+from scripts.init_partition_ontologies import EMPTY_MASTER_ONTOLOGIES
+
+from ..helpers.logging import print_banner, print_usage_summary
 from ..helpers.config import get_data_source_path
 from ..helpers.checklist import load_checklist, save_checklist
-from ..helpers.filesystem import reset_ontology_folder
+from ..helpers.filesystem import reset_ontology_folder, write_bytes_atomic
+from ..helpers.partitions import get_all_partitions
+from ..helpers.runtime import run_async
 from ..agents.ontology_agent import run_ontology_agent
 
+# Partition agents allowed to run at once. Agents are bound by API rate limits,
+# not CPU, so more sessions than this mostly queue up at the provider.
+ONTOLOGY_PARALLELISM = int(os.environ.get("KARTO_ONTOLOGY_PARALLELISM", "4"))
 
-def get_all_partitions() -> List[Dict]:
-    """
-    Get list of all partition files with their data.
-    
-    Returns:
-        List of partition dictionaries with partition_id, title, paths, etc.
-    """
-    partitions_dir = Path("partitions")
-    
-    if not partitions_dir.exists():
-        return []
-    
-    partitions = []
-    for file_path in sorted(partitions_dir.glob("partition_*.json")):
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            data["_file_path"] = str(file_path)
-            partitions.append(data)
-    
-    return partitions
+# Checklist tracking per-partition ontology progress
+CHECKLIST_ID = "03_create_ontologies_for_each_partition"
 
 
 def generate_ontology_checklist(partitions: List[Dict], data_source_path: str) -> Dict:
@@ -58,7 +47,7 @@ def generate_ontology_checklist(partitions: List[Dict], data_source_path: str) -
         The generated checklist dictionary
     """
     checklist = {
-        "checklist_id": "03_create_ontologies_for_each_partition",
+        "checklist_id": CHECKLIST_ID,
         "title": "Create Ontologies for Each Partition",
         "description": "Define entity and relationship ontologies for each partition",
         "special_commands": [
@@ -70,6 +59,10 @@ def generate_ontology_checklist(partitions: List[Dict], data_source_path: str) -
         "items": []
     }
     
+    # Prefix for file paths given relative to the data source; built once for
+    # every partition rather than per file
+    data_source_prefix = f"{data_source_path}/"
+    
     for partition in partitions:
         partition_id = partition.get("partition_id")
         title = partition.get("title", "Unknown")
@@ -78,10 +71,13 @@ def generate_ontology_checklist(partitions: List[Dict], data_source_path: str) -
         # Create item ID (e.g., "3.1" for partition 1, "3.2" for partition 2)
         item_id = f"3.{partition_id}"
         
+        # Zero-padded file name shared by the item description and first subtask
+        partition_file_name = f"partition_{partition_id:02d}.json"
+        
         # Create the item for this partition
         item = {
             "item_id": item_id,
-            "description": f"Create entity and relationship ontologies for partition_{partition_id:02d}.json: {title}",
+            "description": f"Create entity and relationship ontologies for {partition_file_name}: {title}",
             "completed": False,
             "subtasks": []
         }
@@ -89,23 +85,21 @@ def generate_ontology_checklist(partitions: List[Dict], data_source_path: str) -
         # First subtask is always the partition JSON file itself
         item["subtasks"].append({
             "item_id": f"{item_id}.1",
-            "file": f"partitions/partition_{partition_id:02d}.json",
+            "file": f"partitions/{partition_file_name}",
             "description": f"Review entire partition and create complete ontologies",
             "completed": False
         })
         
-        # Add a subtask for each file in the partition
-        subtask_num = 2
-        for path in paths:
-            # Build full path relative to data source
-            full_path = f"{data_source_path}/{path}" if not path.startswith(data_source_path) else path
-            
-            item["subtasks"].append({
+        # Add a subtask for each file in the partition (numbered from 2), with
+        # paths made relative to the data source
+        item["subtasks"].extend([
+            {
                 "item_id": f"{item_id}.{subtask_num}",
-                "file": full_path,
+                "file": path if path.startswith(data_source_path) else data_source_prefix + path,
                 "completed": False
-            })
-            subtask_num += 1
+            }
+            for subtask_num, path in enumerate(paths, start=2)
+        ])
         
         checklist["items"].append(item)
     
@@ -122,25 +116,76 @@ def init_master_ontologies() -> bool:
     ontology_dir = Path("ontology")
     ontology_dir.mkdir(parents=True, exist_ok=True)
     
-    # Create master entity ontology file
-    entity_path = ontology_dir / "master_entity_ontology.json"
-    entity_ontology = {"entities": []}
+    # Contents are fixed, so write the pre-serialized bytes directly
+    for file_name, content in EMPTY_MASTER_ONTOLOGIES.items():
+        write_bytes_atomic(ontology_dir / file_name, content)
     
-    with open(entity_path, 'w') as f:
-        json.dump(entity_ontology, f, indent=2)
+    print(f"  ✓ Created master ontology files")
+    return True
+
+
+def _checklist_shape(checklist: Dict) -> List:
+    """Return the item and subtask ids and files of a checklist, ignoring progress."""
+    return [
+        (item.get("item_id"), [(st.get("item_id"), st.get("file")) for st in item.get("subtasks", [])])
+        for item in checklist.get("items", [])
+    ]
+
+
+def _incomplete_subtask_counts(checklist: Dict) -> Dict[str, int]:
+    """
+    Count incomplete subtasks per incomplete item in a single sweep.
     
-    # Create master relationship ontology file
-    relationship_path = ontology_dir / "master_relationship_ontology.json"
-    relationship_ontology = {"relationships": []}
+    Returns:
+        Dict mapping item_id to its number of incomplete subtasks; items that
+        are complete or have no incomplete subtasks are left out
+    """
+    counts = {}
+    for item in checklist.get("items", []):
+        if item.get("completed", False):
+            continue
+        
+        incomplete_count = 0
+        for subtask in item.get("subtasks", []):
+            if not subtask.get("completed", False):
+                incomplete_count += 1
+        
+        if incomplete_count:
+            counts[item.get("item_id")] = incomplete_count
     
-    with open(relationship_path, 'w') as f:
-        json.dump(relationship_ontology, f, indent=2)
+    return counts
+
+
+def load_resumable_checklist(checklist: Dict) -> Optional[Dict]:
+    """
+    Get the checklist of an earlier step 3 run that can be resumed.
     
-    print(f"  ✓ Created master ontology files")
-    return True
+    A previous checklist is only reused if it covers exactly the same partitions
+    and files as the freshly generated one and the master ontology files it
+    was filling in still exist; otherwise its progress does not apply.
+    
+    Args:
+        checklist: Checklist generated from the current partitions
+        
+    Returns:
+        The previous checklist (with its completion state), or None
+    """
+    try:
+        existing = load_checklist(CHECKLIST_ID)
+    except FileNotFoundError:
+        return None
+    
+    ontology_dir = Path("ontology")
+    if not all((ontology_dir / file_name).exists() for file_name in EMPTY_MASTER_ONTOLOGIES):
+        return None
+    
+    if _checklist_shape(existing) != _checklist_shape(checklist):
+        return None
+    
+    return existing
 
 
-def step_3_create_ontologies_for_each_partition() -> bool:
+def step_3_create_ontologies_for_each_partition(force: bool = False) -> bool:
     """
     Execute step 3: Create ontologies for each partition using Claude Code Agent SDK
     
@@ -151,16 +196,19 @@ def step_3_create_ontologies_for_each_partition() -> bool:
     4. Spawns one Claude agent per partition to create ontologies
     5. Waits for all agents to complete
     
+    If an earlier run's checklist matches the current partitions, the reset is
+    skipped and agents run only for partitions whose items are incomplete.
+    
+    Args:
+        force: Always start from scratch, discarding earlier progress
+    
     Returns:
         True if all ontologies were created successfully
     """
     # ========================================================================
     # RESET: Clear existing ontologies and generate checklist
     # ========================================================================
-    print("\n" + "=" * 60)
-    print("PREPARING STEP 3: ONTOLOGY CREATION")
-    print("=" * 60)
-    print()
+    print_banner("PREPARING STEP 3: ONTOLOGY CREATION", blank_before=True, blank_after=True)
     
     # Get data source path
     data_source_path = get_data_source_path()
@@ -174,16 +222,32 @@ def step_3_create_ontologies_for_each_partition() -> bool:
     
     print(f"  Found {len(partitions)} partitions")
     
-    # Reset ontology folder
-    reset_ontology_folder()
-    
-    # Initialize empty master ontology files
-    init_master_ontologies()
-    
     # Generate the checklist dynamically
     checklist = generate_ontology_checklist(partitions, data_source_path)
-    save_checklist("03_create_ontologies_for_each_partition", checklist)
-    print(f"  ✓ Generated checklist with {len(checklist['items'])} items")
+    
+    # Resume an earlier run for the same partitions instead of discarding its work
+    previous_checklist = None if force else load_resumable_checklist(checklist)
+    
+    if previous_checklist is not None:
+        checklist = previous_checklist
+        pending_item_ids = _incomplete_subtask_counts(checklist)
+        
+        if not pending_item_ids:
+            print("  ✓ Checklist from a previous run is already complete - nothing to do")
+            print("    (pass --force to recreate the ontologies from scratch)")
+            return True
+        
+        partitions = [p for p in partitions if f"3.{p.get('partition_id')}" in pending_item_ids]
+        print(f"  ✓ Resuming previous run: {len(partitions)} partition(s) still incomplete")
+    else:
+        # Reset ontology folder
+        reset_ontology_folder()
+        
+        # Initialize empty master ontology files
+        init_master_ontologies()
+        
+        save_checklist(CHECKLIST_ID, checklist)
+        print(f"  ✓ Generated checklist with {len(checklist['items'])} items")
     
     # Count total subtasks
     total_subtasks = sum(len(item.get("subtasks", [])) for item in checklist["items"])
@@ -195,31 +259,37 @@ def step_3_create_ontologies_for_each_partition() -> bool:
     # STEP 3: Create Ontologies (spawn agent per partition)
     # ========================================================================
     
-    print("=" * 60)
-    print("STEP 3: Creating Ontologies for Each Partition")
-    print("=" * 60)
-    print()
-    print(f"📋 Spawning {len(partitions)} agents (one per partition)")
+    print_banner("STEP 3: Creating Ontologies for Each Partition", blank_after=True)
+    print(f"📋 Spawning {len(partitions)} agents (one per partition, up to {ONTOLOGY_PARALLELISM} at a time)")
     print(f"   Data source: {data_source_path}")
     print()
     
     async def run_all_agents():
-        """Run all partition agents concurrently."""
-        tasks = [run_ontology_agent(partition, data_source_path) for partition in partitions]
-        results = await asyncio.gather(*tasks)
-        return results
+        """Run all partition agents concurrently, at most ONTOLOGY_PARALLELISM at once."""
+        semaphore = asyncio.Semaphore(ONTOLOGY_PARALLELISM)
+        
+        async def run_bounded(partition: Dict):
+            async with semaphore:
+                return await run_ontology_agent(partition, data_source_path)
+        
+        tasks = [asyncio.create_task(run_bounded(partition)) for partition in partitions]
+        
+        # Report each agent as it finishes instead of only once all are done
+        for finished, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+            partition_id, success, _ = await next_done
+            status = "done" if success else "failed"
+            print(f"  [{finished}/{len(tasks)}] Partition {partition_id} agent {status}")
+        
+        # Results in partition order for the summary below
+        return [task.result() for task in tasks]
     
     # Run all agents
-    print(f"\n{'='*60}")
-    print("Running Agents...")
-    print(f"{'='*60}\n")
+    print_banner("Running Agents...", blank_before=True, blank_after=True)
     
-    results = asyncio.run(run_all_agents())
+    results = run_async(run_all_agents())
     
     # Process results
-    print(f"\n{'='*60}")
-    print("Agent Results")
-    print(f"{'='*60}\n")
+    print_banner("Agent Results", blank_before=True, blank_after=True)
     
     all_success = True
     for partition_id, success, error in results:
@@ -230,29 +300,17 @@ def step_3_create_ontologies_for_each_partition() -> bool:
             all_success = False
     
     # Verify all checklist items are complete
-    print(f"\n{'='*60}")
-    print("Verifying Checklist Completion")
-    print(f"{'='*60}\n")
-    
-    final_checklist = load_checklist("03_create_ontologies_for_each_partition")
-    incomplete_items = []
-    
-    for item in final_checklist.get("items", []):
-        if not item.get("completed", False):
-            incomplete_subtasks = [
-                st for st in item.get("subtasks", []) 
-                if not st.get("completed", False)
-            ]
-            if incomplete_subtasks:
-                incomplete_items.append({
-                    "item_id": item.get("item_id"),
-                    "incomplete_count": len(incomplete_subtasks)
-                })
+    print_banner("Verifying Checklist Completion", blank_before=True, blank_after=True)
+    
+    # Agents update the checklist from their own processes, so this load re-parses
+    # it once; the counts below are taken from that single in-memory copy
+    final_checklist = load_checklist(CHECKLIST_ID)
+    incomplete_items = _incomplete_subtask_counts(final_checklist)
     
     if incomplete_items:
         print("⚠️  Some items are not fully complete:")
-        for item in incomplete_items:
-            print(f"   - {item['item_id']}: {item['incomplete_count']} incomplete subtask(s)")
+        for item_id, incomplete_count in incomplete_items.items():
+            print(f"   - {item_id}: {incomplete_count} incomplete subtask(s)")
         print()
     else:
         print("✅ All checklist items are complete!")